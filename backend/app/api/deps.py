@@ -1,6 +1,5 @@
 """API dependencies for dependency injection."""
 
-import uuid
 from typing import Annotated, Optional
 
 from fastapi import Depends, Header, Request
@@ -10,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.exceptions import ForbiddenError, UnauthorizedError
 from app.core.security import verify_token
 from app.db.session import get_session
+from app.models.ids import parse_uuid
 from app.models.user import User
 from app.services.user_service import UserService
 
@@ -35,7 +35,7 @@ async def get_current_user(
         raise UnauthorizedError(message="Invalid token")
 
     user_service = UserService(session)
-    user = await user_service.get_by_id(uuid.UUID(user_id))
+    user = await user_service.get_by_id(parse_uuid(user_id))
 
     if not user:
         raise UnauthorizedError(message="User not found")
@@ -65,7 +65,7 @@ async def get_current_user_optional(
             return None
 
         user_service = UserService(session)
-        user = await user_service.get_by_id(uuid.UUID(user_id))
+        user = await user_service.get_by_id(parse_uuid(user_id))
 
         if user and user.is_active:
             return user
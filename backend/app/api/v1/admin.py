@@ -451,7 +451,7 @@ async def create_admin(
 ):
     """Create a new superuser account."""
     from app.core.exceptions import BadRequestError
-    from app.core.security import get_password_hash
+    from app.core.security import aget_password_hash
 
     # Check for duplicate email
     existing = await session.execute(select(User).where(User.email == data.email.lower()))
@@ -461,7 +461,7 @@ async def create_admin(
     new_admin = User(
         email=data.email.lower(),
         full_name=data.full_name,
-        hashed_password=get_password_hash(data.password),
+        hashed_password=await aget_password_hash(data.password),
         is_verified=True,
         is_superuser=True,
         is_active=True,
@@ -31,7 +31,7 @@ from app.schemas.auth import (
     TokenResponse,
     VerifyEmailRequest,
 )
-from app.schemas.common import MessageResponse
+from app.schemas.common import MessageResponse, model_json_response
 from app.services.auth_service import AuthService
 from app.services.email_service import email_service
 
@@ -106,7 +106,7 @@ async def login(
             user_agent=user_agent,
             success=True,
         )
-        return result
+        return model_json_response(result)
     except Exception as e:
         # Log failed login attempt
         log_login_attempt(
@@ -126,7 +126,7 @@ async def refresh_token(
 ):
     """Refresh access token."""
     auth_service = AuthService(session)
-    return await auth_service.refresh_tokens(data.refresh_token)
+    return model_json_response(await auth_service.refresh_tokens(data.refresh_token))
 
 
 @router.post("/verify-email", response_model=MessageResponse)
@@ -7,7 +7,8 @@ Usage is tracked for analytics purposes only.
 
 import time
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Body, Response
+from pydantic import TypeAdapter
 
 from app.api.deps import ClientIP, DbSession, OptionalUser, UserAgent
 from app.models.history import ToolType
@@ -17,6 +18,12 @@ from app.services.usage_service import UsageService
 
 router = APIRouter()
 
+# Maximum number of calculations accepted by /batch
+MAX_BATCH_SIZE = 32
+
+# Serializer for batch results, built once at import
+_BATCH_RESPONSE_ADAPTER = TypeAdapter(list[CalculatorResponse])
+
 
 @router.post("/calculate", response_model=CalculatorResponse)
 async def calculate(
@@ -55,6 +62,47 @@ async def calculate(
     return result
 
 
+@router.post("/batch", response_model=list[CalculatorResponse])
+async def calculate_batch(
+    data: list[CalculatorRequest] = Body(min_length=1, max_length=MAX_BATCH_SIZE),
+    session: DbSession = None,
+    user: OptionalUser = None,
+    client_ip: ClientIP = None,
+    user_agent: UserAgent = None,
+):
+    """
+    Perform several calculations in one request.
+
+    The whole list is validated in a single pass and results are returned
+    in request order. Like /calculate this is FREE for all users; the batch
+    is recorded as one analytics event.
+    """
+    start_time = time.time()
+
+    calc_service = CalculatorService()
+    results = [calc_service.calculate(item) for item in data]
+
+    processing_time = int((time.time() - start_time) * 1000)
+    usage_service = UsageService(session)
+    await usage_service.record_usage_analytics_only(
+        tool=ToolType.CALCULATOR,
+        operation="batch",
+        user=user,
+        ip_address=client_ip,
+        user_agent=user_agent,
+        input_metadata={
+            "count": len(data),
+            "operations": sorted({item.operation.value for item in data}),
+        },
+        processing_time_ms=processing_time,
+    )
+
+    return Response(
+        content=_BATCH_RESPONSE_ADAPTER.dump_json(results),
+        media_type="application/json",
+    )
+
+
 @router.get("/units")
 async def get_unit_categories():
     """Get available unit conversion categories and units."""
@@ -17,6 +17,7 @@ from app.api.deps import ClientIP, DbSession, OptionalUser, UserAgent
 from app.config import settings
 from app.core.exceptions import BadRequestError
 from app.models.history import ToolType
+from app.schemas.common import model_json_response
 from app.schemas.tools import ExcelResponse
 from app.services.tools.excel_service import ExcelService
 from app.services.usage_service import UsageService
@@ -115,13 +116,13 @@ async def excel_to_csv(
         processing_time_ms=processing_time,
     )
 
-    return ExcelResponse(
+    return model_json_response(ExcelResponse(
         operation="to_csv",
         sheet_count=len(csv_results),
         sheets_processed=[r[0] for r in csv_results],
         result_files=saved_files,
         total_size_bytes=total_size,
-    )
+    ))
 
 
 @router.post("/to-csv/zip")
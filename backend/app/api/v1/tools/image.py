@@ -19,6 +19,7 @@ from app.core.exceptions import BadRequestError
 from app.core.file_validation import validate_image_file
 from app.core.rate_limiter import limiter, IMAGE_RATE_LIMIT, IMAGE_BATCH_RATE_LIMIT
 from app.models.history import ToolType
+from app.schemas.common import model_json_response
 from app.schemas.tools import ImageFormat, ImageOperation, ImageRequest, ImageResponse
 from app.services.tools.image_service import ImageService
 from app.services.usage_service import UsageService
@@ -204,14 +205,14 @@ async def process_image(
     suffix = op_map.get(operation.value, operation.value)
     out_name = _output_name(file.filename, suffix, output_format.value if output_format.value != "jpeg" else "jpg")
 
-    return ImageResponse(
+    return model_json_response(ImageResponse(
         operation=operation,
         original_size=original_size,
         new_size=new_size,
         format=output_format.value,
         file_size_bytes=len(result_bytes),
         download_url=f"/api/v1/tools/image/download/{filename}?name={out_name}",
-    )
+    ))
 
 
 @router.get("/download/{filename}")
@@ -431,7 +432,7 @@ async def batch_process_images(
             })
 
     # Record single usage for batch
-    await usage_service.check_and_record_usage(
+    history, _ = await usage_service.check_and_record_usage(
         tool=ToolType.IMAGE,
         operation=f"batch_{operation.value}",
         user=user,
@@ -439,5 +440,6 @@ async def batch_process_images(
         user_agent=user_agent,
         input_metadata={"file_count": len(files)},
     )
+    await usage_service.complete_usage(history=history, processing_time_ms=0)
 
     return {"results": results}
@@ -132,6 +132,8 @@ async def batch_image_to_text(
             language=language,
             output_dir=TEMP_DIR,
         )
+        # Processing happens in the Celery task; store the record as queued
+        await usage_service.complete_usage(history=history, processing_time_ms=0)
         
         tasks.append({
             "filename": file_info["original_filename"],
@@ -15,6 +15,7 @@ from app.core.exceptions import BadRequestError
 from app.core.file_validation import validate_pdf_file
 from app.core.rate_limiter import limiter, PDF_RATE_LIMIT
 from app.models.history import ToolType
+from app.schemas.common import model_json_response
 from app.schemas.tools import PDFOperation, PDFResponse
 from app.services.tools.pdf_service import PDFService
 from app.services.usage_service import UsageService
@@ -108,12 +109,12 @@ async def split_pdf(
         output_metadata={"files_created": len(saved_files), "total_size": total_size},
     )
 
-    return PDFResponse(
+    return model_json_response(PDFResponse(
         operation=PDFOperation.SPLIT,
         original_pages=total_pages,
         result_files=saved_files,
         total_size_bytes=total_size,
-    )
+    ))
 
 
 @router.post("/merge", response_model=PDFResponse)
@@ -186,7 +187,7 @@ async def merge_pdfs(
 
     first_name = files[0].filename if files else None
     out_name = _output_name(first_name, "merged", "pdf")
-    return PDFResponse(
+    return model_json_response(PDFResponse(
         operation=PDFOperation.MERGE,
         original_pages=total_pages,
         result_files=[{
@@ -196,7 +197,7 @@ async def merge_pdfs(
             "download_url": f"/api/v1/tools/pdf/download/{filename}?name={out_name}",
         }],
         total_size_bytes=len(merged_bytes),
-    )
+    ))
 
 
 @router.post("/compress", response_model=PDFResponse)
@@ -262,7 +263,7 @@ async def compress_pdf(
     )
 
     out_name = _output_name(file.filename, "compressed", "pdf")
-    return PDFResponse(
+    return model_json_response(PDFResponse(
         operation=PDFOperation.COMPRESS,
         original_pages=total_pages,
         result_files=[{
@@ -273,7 +274,7 @@ async def compress_pdf(
             "compression_ratio": f"{compression_ratio:.1f}%",
         }],
         total_size_bytes=len(compressed_bytes),
-    )
+    ))
 
 
 @router.post("/to-word")
@@ -6,6 +6,7 @@ from fastapi.responses import Response
 
 from app.api.deps import ClientIP, DbSession, OptionalUser, UserAgent
 from app.models.history import ToolType
+from app.schemas.common import model_json_response
 from app.schemas.tools import QRCodeRequest, QRCodeResponse
 from app.services.tools.qrcode_service import QRCodeService
 from app.services.usage_service import UsageService
@@ -54,12 +55,12 @@ async def generate_qrcode(
         },
     )
 
-    return QRCodeResponse(
+    return model_json_response(QRCodeResponse(
         image_base64=result,
         format=data.format,
         size=data.size,
         content_type=data.content_type,
-    )
+    ))
 
 
 @router.post("/generate/download")
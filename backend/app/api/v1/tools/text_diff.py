@@ -5,18 +5,53 @@ Usage is tracked for analytics purposes only.
 """
 
 import difflib
+import hashlib
+import re
 import time
+from collections import OrderedDict
 from typing import Optional, List
 
-from fastapi import APIRouter
+from fastapi import APIRouter, BackgroundTasks
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.api.deps import ClientIP, DbSession, OptionalUser, UserAgent
+from app.core.jsonutil import dumps_bytes
 from app.models.history import ToolType
+from app.models.user import User
 from app.services.usage_service import UsageService
 
 router = APIRouter()
 
+# Inputs beyond these limits skip the side-by-side matcher, which can take
+# minutes on very large or very lopsided inputs
+MAX_SIDE_BY_SIDE_LINES = 20_000
+MAX_LINE_COUNT_SKEW = 0.9
+MIN_LINES_FOR_SKEW_CHECK = 1_000
+
+# Repeated /compare and /similarity requests with the same texts (refreshes,
+# retries) are served from an LRU cache keyed on content hashes. Usage is
+# still recorded per request. Compare results are cached as encoded JSON and
+# the cache is bounded by total size as well as entry count.
+RESULT_CACHE_SIZE = 128
+RESULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+MAX_CACHED_RESULT_BYTES = 1024 * 1024
+MAX_CACHED_TEXT_BYTES = 1024 * 1024
+_result_cache: OrderedDict[tuple, tuple[object, int]] = OrderedDict()
+_result_cache_bytes = 0
+
+# Line diffs larger than this let SequenceMatcher drop "popular" lines as junk
+AUTOJUNK_MIN_LINES = 5_000
+
+# Word diffs with at least this many tokens run the Myers bisect kernel through
+# numba when it is installed; below it the JIT call overhead isn't worth it
+JIT_MIN_TOKENS = 2_000
+
+# numba-compiled Myers kernel, set by warm_jit_bisect once it has compiled
+_jit_bisect = None
+
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
 
 class TextDiffRequest(BaseModel):
     """Request for text comparison."""
@@ -39,6 +74,7 @@ class TextDiffResponse(BaseModel):
     diff_lines: Optional[List[DiffLine]] = None
     unified_diff: Optional[str] = None
     stats: Optional[dict] = None
+    truncated: bool = False  # True when diff_lines only covers the unified diff hunks
     error: Optional[str] = None
 
 
@@ -55,7 +91,462 @@ class TextSimilarityResponse(BaseModel):
     are_identical: bool
 
 
-@router.post("/compare", response_model=TextDiffResponse)
+def _common_affix_lengths(a: list, b: list) -> tuple[int, int]:
+    """Return the lengths of the identical leading and trailing runs of a and b."""
+    limit = min(len(a), len(b))
+    prefix = 0
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+
+    limit -= prefix
+    suffix = 0
+    while suffix < limit and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    return prefix, suffix
+
+
+def _intern_sequences(a: list, b: list) -> tuple[list[int], list[int]]:
+    """Map the elements of a and b to small ints, equal elements sharing an id."""
+    pool: dict = {}
+    ids_a = [pool.setdefault(item, len(pool)) for item in a]
+    ids_b = [pool.setdefault(item, len(pool)) for item in b]
+    return ids_a, ids_b
+
+
+def _diff_opcodes(a: list, b: list) -> list[tuple[str, int, int, int, int]]:
+    """
+    Get SequenceMatcher-style opcodes for a and b.
+
+    Shared leading/trailing elements are stripped before matching, so the
+    matcher only sees the region that actually changed (e.g. one edited
+    line in a 1000-line document). The remaining elements are interned to
+    small ints so the matcher hashes and compares ints rather than strings.
+    """
+    prefix, suffix = _common_affix_lengths(a, b)
+    end_a = len(a) - suffix
+    end_b = len(b) - suffix
+
+    opcodes = []
+    if prefix:
+        opcodes.append(('equal', 0, prefix, 0, prefix))
+
+    ids_a, ids_b = _intern_sequences(a[prefix:end_a], b[prefix:end_b])
+    # autojunk treats frequent elements (blank lines, lone braces) as junk once
+    # a sequence passes 200 entries, which gives surprising non-minimal diffs.
+    # Only keep it for large inputs, where it bounds the matcher's cost.
+    autojunk = len(a) + len(b) > AUTOJUNK_MIN_LINES
+    matcher = difflib.SequenceMatcher(None, ids_a, ids_b, autojunk=autojunk)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+
+    if suffix:
+        opcodes.append(('equal', end_a, len(a), end_b, len(b)))
+
+    return opcodes
+
+
+def _myers_bisect(
+    a: list, a_lo: int, a_hi: int, b: list, b_lo: int, b_hi: int
+) -> tuple[int, int]:
+    """
+    Find the middle snake of a[a_lo:a_hi] vs b[b_lo:b_hi] (Myers, linear space).
+
+    Runs the forward and reverse O(ND) searches until their furthest-reaching
+    paths overlap and returns the split point (x, y) relative to a_lo/b_lo, or
+    (-1, -1) if the ranges share nothing. Each search keeps a single flat
+    V array indexed by diagonal, so no per-step copies are made.
+    """
+    n = a_hi - a_lo
+    m = b_hi - b_lo
+    max_d = (n + m + 1) // 2
+    v_offset = max_d
+    v_length = 2 * max_d + 2
+    v1 = [-1] * v_length
+    v1[v_offset + 1] = 0
+    v2 = v1[:]
+    delta = n - m
+    # If the total number of elements is odd, the forward path overlaps first
+    front = delta % 2 != 0
+    k1start = k1end = k2start = k2end = 0
+
+    for d in range(max_d):
+        # Walk the forward path one step
+        for k1 in range(-d + k1start, d + 1 - k1end, 2):
+            k1_offset = v_offset + k1
+            if k1 == -d or (k1 != d and v1[k1_offset - 1] < v1[k1_offset + 1]):
+                x1 = v1[k1_offset + 1]
+            else:
+                x1 = v1[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[a_lo + x1] == b[b_lo + y1]:
+                x1 += 1
+                y1 += 1
+            v1[k1_offset] = x1
+            if x1 > n:
+                k1end += 2  # Ran off the right of the graph
+            elif y1 > m:
+                k1start += 2  # Ran off the bottom of the graph
+            elif front:
+                k2_offset = v_offset + delta - k1
+                if 0 <= k2_offset < v_length and v2[k2_offset] != -1:
+                    if x1 >= n - v2[k2_offset]:
+                        return x1, y1
+
+        # Walk the reverse path one step
+        for k2 in range(-d + k2start, d + 1 - k2end, 2):
+            k2_offset = v_offset + k2
+            if k2 == -d or (k2 != d and v2[k2_offset - 1] < v2[k2_offset + 1]):
+                x2 = v2[k2_offset + 1]
+            else:
+                x2 = v2[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < n and y2 < m and a[a_hi - 1 - x2] == b[b_hi - 1 - y2]:
+                x2 += 1
+                y2 += 1
+            v2[k2_offset] = x2
+            if x2 > n:
+                k2end += 2
+            elif y2 > m:
+                k2start += 2
+            elif not front:
+                k1_offset = v_offset + delta - k2
+                if 0 <= k1_offset < v_length and v1[k1_offset] != -1:
+                    x1 = v1[k1_offset]
+                    if x1 >= n - x2:
+                        return x1, v_offset + x1 - k1_offset
+
+    return -1, -1
+
+
+def warm_jit_bisect():
+    """
+    Compile the Myers bisect kernel with numba, if it is installed.
+
+    Runs in a background thread at worker startup. numba compiles on the first
+    call, so the kernel is called once on a tiny input here rather than on a
+    request's event loop.
+    """
+    global _jit_bisect
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        return
+    try:
+        # cache=True persists the compiled kernel so only the first worker pays the JIT cost
+        kernel = numba.njit(cache=True)(_myers_bisect)
+        sample = np.array([0, 1], dtype=np.int64)
+        kernel(sample, 0, 2, sample[::-1].copy(), 0, 2)
+    except Exception as e:
+        print(f"Warning: Failed to compile the Myers diff kernel: {e}")
+        return
+    _jit_bisect = kernel
+
+
+def _get_jit_bisect():
+    """Get the compiled Myers bisect kernel, or None until warm_jit_bisect has finished."""
+    return _jit_bisect
+
+
+def _myers_opcodes(a: list, b: list) -> list[tuple[str, int, int, int, int]]:
+    """
+    Get SequenceMatcher-style opcodes for a and b using Myers' O((N+M)D) diff.
+
+    Much faster than SequenceMatcher when the edit distance D is small, which
+    is the common case for word-level edits. Produces a minimal diff rather
+    than Ratcliff-Obershelp's "human-looking" one, so /similarity keeps using
+    SequenceMatcher.
+    """
+    bisect = _myers_bisect
+    bisect_a, bisect_b = a, b
+    if len(a) + len(b) >= JIT_MIN_TOKENS:
+        jit_bisect = _get_jit_bisect()
+        if jit_bisect is not None:
+            import numpy as np
+            # numba can't work on str lists, so hand it interned int64 arrays
+            ids_a, ids_b = _intern_sequences(a, b)
+            bisect = jit_bisect
+            bisect_a = np.array(ids_a, dtype=np.int64)
+            bisect_b = np.array(ids_b, dtype=np.int64)
+
+    blocks = []  # (i, j, size) runs of equal elements
+    pending = [(0, len(a), 0, len(b))]
+
+    while pending:
+        a_lo, a_hi, b_lo, b_hi = pending.pop()
+
+        # Trim the common prefix and suffix of this range
+        start = a_lo
+        while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+            a_lo += 1
+            b_lo += 1
+        if a_lo > start:
+            blocks.append((start, b_lo - (a_lo - start), a_lo - start))
+
+        end = a_hi
+        while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+            a_hi -= 1
+            b_hi -= 1
+        if a_hi < end:
+            blocks.append((a_hi, b_hi, end - a_hi))
+
+        if a_lo == a_hi or b_lo == b_hi:
+            continue  # Pure insertion or deletion
+
+        x, y = bisect(bisect_a, a_lo, a_hi, bisect_b, b_lo, b_hi)
+        if x < 0:
+            continue  # Nothing in common: a single replace
+        pending.append((a_lo, a_lo + x, b_lo, b_lo + y))
+        pending.append((a_lo + x, a_hi, b_lo + y, b_hi))
+
+    # Convert matching blocks to opcodes the same way SequenceMatcher does
+    blocks.sort()
+    blocks.append((len(a), len(b), 0))
+    opcodes = []
+    i = j = 0
+    for ai, bj, size in blocks:
+        if i < ai and j < bj:
+            opcodes.append(('replace', i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(('delete', i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(('insert', i, ai, j, bj))
+        if size:
+            if opcodes and opcodes[-1][0] == 'equal' and opcodes[-1][2] == ai:
+                # Merge runs split across adjacent sub-problems
+                opcodes[-1] = ('equal', opcodes[-1][1], ai + size, opcodes[-1][3], bj + size)
+            else:
+                opcodes.append(('equal', ai, ai + size, bj, bj + size))
+        i, j = ai + size, bj + size
+
+    return opcodes
+
+
+def _exceeds_side_by_side_limits(count1: int, count2: int) -> bool:
+    """Check whether two inputs are too large or lopsided for the side-by-side matcher."""
+    if count1 + count2 > MAX_SIDE_BY_SIDE_LINES:
+        return True
+
+    longest = max(count1, count2)
+    if longest < MIN_LINES_FOR_SKEW_CHECK:
+        return False
+    return abs(count1 - count2) / longest > MAX_LINE_COUNT_SKEW
+
+
+def _diff_lines_from_unified(
+    unified: list[str], content1: list[str], content2: list[str]
+) -> tuple[list[dict], int, int]:
+    """
+    Build side-by-side diff lines from unified diff output in a single pass.
+
+    Line content is taken from content1/content2 (the inputs split without
+    line terminators) by line number. Returns (diff_lines, added_count,
+    removed_count). Only the hunks present in the unified diff are included,
+    each introduced by an 'info' line.
+    """
+    diff_lines = []
+    added_count = 0
+    removed_count = 0
+    left_line_num = 0
+    right_line_num = 0
+
+    # Skip the '---' / '+++' file headers
+    for line in unified[2:]:
+        tag = line[:1]
+        if tag == ' ':
+            left_line_num += 1
+            right_line_num += 1
+            diff_lines.append({
+                'type': 'unchanged',
+                'content': content1[left_line_num - 1],
+                'line_num_left': left_line_num,
+                'line_num_right': right_line_num,
+            })
+        elif tag == '-':
+            left_line_num += 1
+            removed_count += 1
+            diff_lines.append({
+                'type': 'removed',
+                'content': content1[left_line_num - 1],
+                'line_num_left': left_line_num,
+                'line_num_right': None,
+            })
+        elif tag == '+':
+            right_line_num += 1
+            added_count += 1
+            diff_lines.append({
+                'type': 'added',
+                'content': content2[right_line_num - 1],
+                'line_num_left': None,
+                'line_num_right': right_line_num,
+            })
+        elif tag == '@':
+            match = _HUNK_HEADER_RE.match(line)
+            if match:
+                # Hunk starts are 1-based, except for empty ranges which
+                # point at the line preceding the change
+                left_start, left_len, right_start, right_len = match.groups()
+                left_line_num = int(left_start) - (left_len != '0')
+                right_line_num = int(right_start) - (right_len != '0')
+            diff_lines.append({
+                'type': 'info',
+                'content': line,
+                'line_num_left': None,
+                'line_num_right': None,
+            })
+
+    return diff_lines, added_count, removed_count
+
+
+def _compute_comparison(text1: str, text2: str, context_lines: int) -> dict:
+    """Compute the /compare response payload for two texts."""
+    lines1 = text1.splitlines(keepends=True)
+    lines2 = text2.splitlines(keepends=True)
+    # Same lines without terminators, used for the side-by-side content
+    content1 = text1.splitlines()
+    content2 = text2.splitlines()
+
+    # Generate unified diff (a generator; only materialized when parsed below)
+    unified = difflib.unified_diff(
+        lines1, lines2,
+        fromfile='Original',
+        tofile='Modified',
+        lineterm='',
+        n=context_lines
+    )
+
+    truncated = _exceeds_side_by_side_limits(len(lines1), len(lines2))
+    if truncated:
+        unified = list(unified)
+        # Too large or too lopsided for the line matcher: build the
+        # side-by-side view from the unified diff hunks and derive the
+        # stats from line counts instead of a character-level ratio.
+        diff_lines, added_count, removed_count = _diff_lines_from_unified(
+            unified, content1, content2
+        )
+        unchanged_count = len(lines1) - removed_count
+        total_lines = len(lines1) + len(lines2)
+        similarity = 2 * unchanged_count / total_lines if total_lines else 1.0
+    else:
+        # Generate detailed diff lines for side-by-side view
+        diff_lines = []
+
+        # Line numbers are simply the 1-based indices into each input, so
+        # whole opcode blocks can be expanded with one extend() each
+        added_count = removed_count = unchanged_count = 0
+
+        for tag, i1, i2, j1, j2 in _diff_opcodes(lines1, lines2):
+            if tag == 'equal':
+                unchanged_count += i2 - i1
+                shift = j1 - i1
+                diff_lines.extend([{
+                    'type': 'unchanged',
+                    'content': content1[i],
+                    'line_num_left': i + 1,
+                    'line_num_right': i + shift + 1,
+                } for i in range(i1, i2)])
+                continue
+
+            # For 'replace', show removed lines first, then added
+            if tag == 'delete' or tag == 'replace':
+                removed_count += i2 - i1
+                diff_lines.extend([{
+                    'type': 'removed',
+                    'content': content1[i],
+                    'line_num_left': i + 1,
+                    'line_num_right': None,
+                } for i in range(i1, i2)])
+            if tag == 'insert' or tag == 'replace':
+                added_count += j2 - j1
+                diff_lines.extend([{
+                    'type': 'added',
+                    'content': content2[j],
+                    'line_num_left': None,
+                    'line_num_right': j + 1,
+                } for j in range(j1, j2)])
+
+        # Character-level ratio: autojunk stays on to keep this from going quadratic
+        similarity = difflib.SequenceMatcher(
+            None, text1, text2, autojunk=True
+        ).ratio()
+
+    unified_diff = '\n'.join(unified)
+
+    return {
+        "success": True,
+        "diff_lines": diff_lines,
+        "unified_diff": unified_diff,
+        "stats": {
+            "lines_added": added_count,
+            "lines_removed": removed_count,
+            "lines_unchanged": unchanged_count,
+            "total_lines_left": len(lines1),
+            "total_lines_right": len(lines2),
+            "similarity_percent": round(similarity * 100, 1),
+        },
+        "truncated": truncated,
+        "error": None,
+    }
+
+
+def _result_cache_key(kind: str, text1: str, text2: str, *params) -> Optional[tuple]:
+    """
+    Build a result cache key from content hashes of both texts.
+
+    Returns None when the texts are too large to be worth caching.
+    """
+    if len(text1) + len(text2) > MAX_CACHED_TEXT_BYTES:
+        return None
+    data1 = text1.encode()
+    data2 = text2.encode()
+    if len(data1) + len(data2) > MAX_CACHED_TEXT_BYTES:
+        return None
+    return (
+        kind,
+        hashlib.blake2b(data1, digest_size=16).digest(),
+        hashlib.blake2b(data2, digest_size=16).digest(),
+        *params,
+    )
+
+
+def _result_cache_get(key: Optional[tuple]):
+    """Get a cached result, marking it as recently used."""
+    if key is None:
+        return None
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    _result_cache.move_to_end(key)
+    return entry[0]
+
+
+def _result_cache_put(key: Optional[tuple], result, size: int = 0) -> None:
+    """
+    Cache a result of roughly `size` bytes.
+
+    Results over MAX_CACHED_RESULT_BYTES are not cached; least recently used
+    entries are evicted until the cache is back within its count and byte budgets.
+    """
+    global _result_cache_bytes
+    if key is None or size > MAX_CACHED_RESULT_BYTES:
+        return
+    previous = _result_cache.pop(key, None)
+    if previous is not None:
+        _result_cache_bytes -= previous[1]
+    _result_cache[key] = (result, size)
+    _result_cache_bytes += size
+    while (
+        len(_result_cache) > RESULT_CACHE_SIZE
+        or _result_cache_bytes > RESULT_CACHE_MAX_BYTES
+    ):
+        _result_cache_bytes -= _result_cache.popitem(last=False)[1][1]
+
+
+# Lines are built as plain dicts and returned as pre-encoded JSON so large diffs
+# don't pay for one pydantic model per line plus response re-validation;
+# TextDiffResponse/DiffLine are kept for the OpenAPI schema.
+@router.post("/compare", response_model=None, responses={200: {"model": TextDiffResponse}})
 async def compare_texts(
     data: TextDiffRequest,
     session: DbSession = None,
@@ -70,94 +561,14 @@ async def compare_texts(
     """
     start_time = time.time()
     try:
-        lines1 = data.text1.splitlines(keepends=True)
-        lines2 = data.text2.splitlines(keepends=True)
-
-        # Generate unified diff
-        unified = list(difflib.unified_diff(
-            lines1, lines2,
-            fromfile='Original',
-            tofile='Modified',
-            lineterm='',
-            n=data.context_lines
-        ))
-        unified_diff = '\n'.join(unified)
-
-        # Generate detailed diff lines for side-by-side view
-        diff_lines = []
-        matcher = difflib.SequenceMatcher(None, lines1, lines2)
-
-        left_line_num = 0
-        right_line_num = 0
-
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-            if tag == 'equal':
-                for i in range(i1, i2):
-                    left_line_num += 1
-                    right_line_num += 1
-                    diff_lines.append(DiffLine(
-                        type='unchanged',
-                        content=lines1[i].rstrip('\n\r'),
-                        line_num_left=left_line_num,
-                        line_num_right=right_line_num,
-                    ))
-            elif tag == 'delete':
-                for i in range(i1, i2):
-                    left_line_num += 1
-                    diff_lines.append(DiffLine(
-                        type='removed',
-                        content=lines1[i].rstrip('\n\r'),
-                        line_num_left=left_line_num,
-                        line_num_right=None,
-                    ))
-            elif tag == 'insert':
-                for j in range(j1, j2):
-                    right_line_num += 1
-                    diff_lines.append(DiffLine(
-                        type='added',
-                        content=lines2[j].rstrip('\n\r'),
-                        line_num_left=None,
-                        line_num_right=right_line_num,
-                    ))
-            elif tag == 'replace':
-                # Show removed lines first, then added
-                for i in range(i1, i2):
-                    left_line_num += 1
-                    diff_lines.append(DiffLine(
-                        type='removed',
-                        content=lines1[i].rstrip('\n\r'),
-                        line_num_left=left_line_num,
-                        line_num_right=None,
-                    ))
-                for j in range(j1, j2):
-                    right_line_num += 1
-                    diff_lines.append(DiffLine(
-                        type='added',
-                        content=lines2[j].rstrip('\n\r'),
-                        line_num_left=None,
-                        line_num_right=right_line_num,
-                    ))
-
-        # Calculate statistics
-        added_count = sum(1 for line in diff_lines if line.type == 'added')
-        removed_count = sum(1 for line in diff_lines if line.type == 'removed')
-        unchanged_count = sum(1 for line in diff_lines if line.type == 'unchanged')
-
-        similarity = difflib.SequenceMatcher(None, data.text1, data.text2).ratio()
-
-        result = TextDiffResponse(
-            success=True,
-            diff_lines=diff_lines,
-            unified_diff=unified_diff,
-            stats={
-                "lines_added": added_count,
-                "lines_removed": removed_count,
-                "lines_unchanged": unchanged_count,
-                "total_lines_left": len(lines1),
-                "total_lines_right": len(lines2),
-                "similarity_percent": round(similarity * 100, 1),
-            }
-        )
+        cache_key = _result_cache_key("compare", data.text1, data.text2, data.context_lines)
+        cached = _result_cache_get(cache_key)
+        if cached is None:
+            payload = _compute_comparison(data.text1, data.text2, data.context_lines)
+            body, stats = dumps_bytes(payload), payload["stats"]
+            _result_cache_put(cache_key, (body, stats), len(body))
+        else:
+            body, stats = cached
 
         # Track usage for analytics
         processing_time = int((time.time() - start_time) * 1000)
@@ -173,19 +584,86 @@ async def compare_texts(
                 "text2_length": len(data.text2),
             },
             output_metadata={
-                "lines_added": added_count,
-                "lines_removed": removed_count,
-                "similarity_percent": round(similarity * 100, 1),
+                "lines_added": stats["lines_added"],
+                "lines_removed": stats["lines_removed"],
+                "similarity_percent": stats["similarity_percent"],
             },
             processing_time_ms=processing_time,
         )
 
-        return result
+        return Response(content=body, media_type="application/json")
     except Exception as e:
-        return TextDiffResponse(
+        return JSONResponse(content=TextDiffResponse(
             success=False,
             error=str(e)
-        )
+        ).model_dump())
+
+
+async def _record_stream_usage(
+    user: Optional[User],
+    client_ip: str,
+    user_agent: Optional[str],
+    text1_length: int,
+    text2_length: int,
+    start_time: float,
+) -> None:
+    """Record /compare-stream analytics once the response has been sent."""
+    processing_time = int((time.time() - start_time) * 1000)
+    await UsageService().record_usage_analytics_only(
+        tool=ToolType.DIFF,
+        operation="compare_stream",
+        user=user,
+        ip_address=client_ip,
+        user_agent=user_agent,
+        input_metadata={
+            "text1_length": text1_length,
+            "text2_length": text2_length,
+        },
+        processing_time_ms=processing_time,
+    )
+
+
+@router.post("/compare-stream")
+async def compare_texts_stream(
+    data: TextDiffRequest,
+    background_tasks: BackgroundTasks,
+    user: OptionalUser = None,
+    client_ip: ClientIP = None,
+    user_agent: UserAgent = None,
+):
+    """
+    Stream the unified diff of two texts as plain text.
+
+    Lines are sent as difflib produces them, so large diffs are never held
+    in memory in full. This endpoint is FREE for all users - usage tracked
+    for analytics only.
+    """
+    start_time = time.time()
+    lines1 = data.text1.splitlines()
+    lines2 = data.text2.splitlines()
+
+    def generate():
+        for line in difflib.unified_diff(
+            lines1, lines2,
+            fromfile='Original',
+            tofile='Modified',
+            lineterm='',
+            n=data.context_lines
+        ):
+            yield line + '\n'
+
+    # Track usage for analytics after the stream completes
+    background_tasks.add_task(
+        _record_stream_usage,
+        user=user,
+        client_ip=client_ip,
+        user_agent=user_agent,
+        text1_length=len(data.text1),
+        text2_length=len(data.text2),
+        start_time=start_time,
+    )
+
+    return StreamingResponse(generate(), media_type="text/plain")
 
 
 @router.post("/similarity", response_model=TextSimilarityResponse)
@@ -202,7 +680,12 @@ async def check_similarity(
     This endpoint is FREE for all users - usage tracked for analytics only.
     """
     start_time = time.time()
-    ratio = difflib.SequenceMatcher(None, data.text1, data.text2).ratio()
+    cache_key = _result_cache_key("similarity", data.text1, data.text2)
+    ratio = _result_cache_get(cache_key)
+    if ratio is None:
+        # autojunk stays on: it bounds the cost of matching long raw strings
+        ratio = difflib.SequenceMatcher(None, data.text1, data.text2, autojunk=True).ratio()
+        _result_cache_put(cache_key, ratio)
 
     result = TextSimilarityResponse(
         similarity_ratio=round(ratio, 4),
@@ -250,10 +733,9 @@ async def word_diff(
     words1 = data.text1.split()
     words2 = data.text2.split()
 
-    matcher = difflib.SequenceMatcher(None, words1, words2)
     diff_result = []
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    for tag, i1, i2, j1, j2 in _myers_opcodes(words1, words2):
         if tag == 'equal':
             diff_result.append({
                 'type': 'unchanged',
@@ -1,11 +1,15 @@
 """Website to PDF conversion endpoints."""
 
+import ipaddress
 import os
 import re
 import time
 import uuid
+from dataclasses import asdict, dataclass
 from typing import Optional
+from urllib.parse import urlsplit
 
+import aiofiles
 from fastapi import APIRouter, Form
 from fastapi.responses import FileResponse
 from pydantic import HttpUrl
@@ -23,22 +27,60 @@ router = APIRouter()
 TEMP_DIR = settings.temp_file_dir
 os.makedirs(TEMP_DIR, exist_ok=True)
 
+# Hostnames made only of decimal, octal or hex labels ("2130706433",
+# "0177.0.0.1", "0x7f000001", "127.1"). Resolvers read these as IPv4
+# addresses even though ipaddress refuses to parse them, and no real domain
+# has an all-numeric top-level label.
+_NUMERIC_HOST_RE = re.compile(r"^(?:0x[0-9a-f]*|\d+)(?:\.(?:0x[0-9a-f]*|\d+))*$")
+
+
+def _is_blocked_host(host: str) -> bool:
+    """Whether a URL hostname must never be fetched.
+
+    Blocks localhost and internal names, any IP literal that is not globally
+    routable (loopback, private, link-local, unique-local, carrier-grade NAT,
+    IPv4-mapped, unspecified, ...) and numeric host forms. urlsplit has
+    already lowercased the host and stripped IPv6 brackets.
+    """
+    host = host.rstrip(".")
+    if not host:
+        return True
+    if host in ("localhost", "internal") or host.endswith((".localhost", ".internal")):
+        return True
+    try:
+        return not ipaddress.ip_address(host).is_global
+    except ValueError:
+        pass
+    return _NUMERIC_HOST_RE.match(host) is not None
+
+
 # Tier limits
-TIER_LIMITS = {
-    "free": {
-        "max_pages": 5,
-        "wait_time": 3000,  # 3 seconds
-        "include_background": False,
-        "custom_headers": False,
-        "pdf_format": "A4",
-    },
-    "pro": {
-        "max_pages": 100,
-        "wait_time": 15000,
-        "include_background": True,
-        "custom_headers": True,
-        "pdf_format": "any",
-    },
+@dataclass(slots=True, frozen=True)
+class TierLimits:
+    """Conversion limits for a subscription tier."""
+
+    max_pages: int
+    wait_time: int  # milliseconds
+    include_background: bool
+    custom_headers: bool
+    pdf_format: str
+
+
+TIER_LIMITS: dict[str, TierLimits] = {
+    "free": TierLimits(
+        max_pages=5,
+        wait_time=3000,  # 3 seconds
+        include_background=False,
+        custom_headers=False,
+        pdf_format="A4",
+    ),
+    "pro": TierLimits(
+        max_pages=100,
+        wait_time=15000,
+        include_background=True,
+        custom_headers=True,
+        pdf_format="any",
+    ),
 }
 
 
@@ -69,11 +111,16 @@ async def convert_website_to_pdf(
     if not url.startswith(("http://", "https://")):
         url = f"https://{url}"
 
-    # Check for blocked domains (security)
-    blocked_domains = ["localhost", "127.0.0.1", "0.0.0.0", "internal", "10.", "192.168.", "172."]
-    for blocked in blocked_domains:
-        if blocked in url.lower():
-            raise BadRequestError(message="This URL is not allowed for security reasons")
+    # Check for blocked hosts (security). Only the hostname is checked, so a
+    # blocked name in the path or query string no longer matters either way.
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:
+        host = ""
+    if not host:
+        raise BadRequestError(message="Invalid URL")
+    if _is_blocked_host(host):
+        raise BadRequestError(message="This URL is not allowed for security reasons")
 
     try:
         # Check and record usage
@@ -97,7 +144,7 @@ async def convert_website_to_pdf(
         # Enforce limits based on tier
         if tier == "free":
             include_background = False
-            wait_for = min(wait_for, limits["wait_time"])
+            wait_for = min(wait_for, limits.wait_time)
             format = "A4"  # Force A4 for free tier
 
         # Validate scale
@@ -122,10 +169,10 @@ async def convert_website_to_pdf(
         )
 
         # Check page limit for tier
-        if page_count > limits["max_pages"]:
+        if page_count > limits.max_pages:
             raise UsageLimitError(
-                message=f"PDF has {page_count} pages. Your {tier} tier allows up to {limits['max_pages']} pages. Please upgrade for more.",
-                details={"page_count": page_count, "limit": limits["max_pages"]},
+                message=f"PDF has {page_count} pages. Your {tier} tier allows up to {limits.max_pages} pages. Please upgrade for more.",
+                details={"page_count": page_count, "limit": limits.max_pages},
             )
 
         # Save to temp file
@@ -133,8 +180,9 @@ async def convert_website_to_pdf(
         filename = f"{file_id}.pdf"
         filepath = os.path.join(TEMP_DIR, filename)
 
-        with open(filepath, "wb") as f:
-            f.write(pdf_bytes)
+        # Write off the event loop so multi-MB PDFs don't stall other requests
+        async with aiofiles.open(filepath, "wb") as f:
+            await f.write(pdf_bytes)
 
         # Complete usage tracking
         processing_time = int((time.time() - start_time) * 1000)
@@ -167,10 +215,10 @@ async def convert_website_to_pdf(
             "preview_url": f"/api/v1/tools/webpdf/preview/{filename}",
             "tier": tier,
             "limits": {
-                "max_pages": limits["max_pages"],
+                "max_pages": limits.max_pages,
                 "features": {
-                    "background": limits["include_background"],
-                    "custom_format": limits["pdf_format"] == "any",
+                    "background": limits.include_background,
+                    "custom_format": limits.pdf_format == "any",
                 },
             },
         }
@@ -247,6 +295,6 @@ async def get_tier_limits(
 
     return {
         "tier": tier,
-        "limits": TIER_LIMITS.get(tier, TIER_LIMITS["free"]),
-        "all_tiers": TIER_LIMITS,
+        "limits": asdict(TIER_LIMITS.get(tier, TIER_LIMITS["free"])),
+        "all_tiers": {name: asdict(limits) for name, limits in TIER_LIMITS.items()},
     }
@@ -65,18 +65,18 @@ async def get_usage_stats(
     usage_service = UsageService(session)
     stats = await usage_service.get_usage_stats(current_user)
 
-    # Convert recent history to serializable format
+    # Convert recent history rows to serializable format
     recent = [
         {
-            "id": str(h.id),
-            "tool": h.tool.value,
-            "operation": h.operation,
-            "processing_time_ms": h.processing_time_ms,
-            "tier_at_use": h.tier_at_use,
-            "success": h.success,
-            "created_at": h.created_at.isoformat(),
+            "id": str(r.id),
+            "tool": r.tool.value,
+            "operation": r.operation,
+            "processing_time_ms": r.processing_time_ms,
+            "tier_at_use": r.tier_at_use,
+            "success": r.success,
+            "created_at": r.created_at.isoformat(),
         }
-        for h in stats["recent_history"]
+        for r in stats["recent_history"]
     ]
 
     return {
@@ -112,15 +112,15 @@ async def get_usage_history(
     return {
         "history": [
             {
-                "id": str(h.id),
-                "tool": h.tool.value,
-                "operation": h.operation,
-                "processing_time_ms": h.processing_time_ms,
-                "tier_at_use": h.tier_at_use,
-                "success": h.success,
-                "created_at": h.created_at.isoformat(),
+                "id": str(r.id),
+                "tool": r.tool.value,
+                "operation": r.operation,
+                "processing_time_ms": r.processing_time_ms,
+                "tier_at_use": r.tier_at_use,
+                "success": r.success,
+                "created_at": r.created_at.isoformat(),
             }
-            for h in history
+            for r in history
         ]
     }
 
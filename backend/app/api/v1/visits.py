@@ -2,8 +2,9 @@
 
 from fastapi import APIRouter, Request
 
-from app.api.deps import DbSession
-from app.models.page_visit import PageVisit, PageVisitCreate
+from app.models.base import utc_now
+from app.models.page_visit import PageVisitCreate
+from app.workers.visit_writer import visit_writer
 
 router = APIRouter()
 
@@ -12,23 +13,29 @@ router = APIRouter()
 async def track_page_visit(
     data: PageVisitCreate,
     request: Request,
-    session: DbSession,
 ):
-    """Track a page visit. Public endpoint — no auth required."""
+    """Track a page visit. Public endpoint — no auth required.
+
+    Visits are buffered and bulk-inserted by the visit writer, so this
+    returns without touching the database.
+    """
     # Get IP from forwarded header (behind proxy) or direct connection
-    forwarded_for = request.headers.get("x-forwarded-for")
-    ip = forwarded_for.split(",")[0].strip() if forwarded_for else (
+    get_header = request.headers.get
+    forwarded_for = get_header("x-forwarded-for")
+    ip = forwarded_for.partition(",")[0].strip() if forwarded_for else (
         request.client.host if request.client else None
     )
-    user_agent = request.headers.get("user-agent")
-
-    visit = PageVisit(
-        path=data.path,
-        referrer=data.referrer,
-        ip_address=ip,
-        user_agent=user_agent,
-    )
+    user_agent = get_header("user-agent")
 
-    session.add(visit)
-    await session.commit()
+    # Stamp the visit now rather than when the writer flushes it, and clip
+    # header values to their column sizes so one row can't fail a batch
+    now = utc_now()
+    visit_writer.enqueue({
+        "path": data.path,
+        "referrer": data.referrer,
+        "ip_address": ip[:45] if ip else None,
+        "user_agent": user_agent[:500] if user_agent else None,
+        "created_at": now,
+        "updated_at": now,
+    })
     return None
@@ -1,3 +1,4 @@
+import ast
 import json
 import secrets
 from functools import lru_cache
@@ -42,11 +43,11 @@ class Settings(BaseSettings):
                     # Try double quotes first
                     return json.loads(v)
                 except json.JSONDecodeError:
-                    # If JSON fails, it might be due to single quotes ['a', 'b']
-                    # We'll try to fix common single quote issues for robustness
+                    # If JSON fails, it might be due to single quotes ['a', 'b'],
+                    # which a Python literal parse handles without rewriting quotes
                     try:
-                        return json.loads(v.replace("'", '"'))
-                    except:
+                        return list(ast.literal_eval(v))
+                    except (ValueError, SyntaxError):
                         pass
             
             # Fallback to comma-separated string
@@ -82,10 +83,18 @@ class Settings(BaseSettings):
     max_file_size_mb: int = 50
     temp_file_dir: str = "/tmp/toolhub"
     temp_file_ttl_hours: int = 1
+    # Size of the default thread pool used for async file I/O (aiofiles)
+    file_io_threads: int = 32
+
+    # Download ML model files once in the Gunicorn master before workers fork
+    preload_shared_model: bool = True
 
     # Rate Limiting (free tier)
     free_daily_uses: int = 3
     rate_limit_per_minute: int = 30
+    # Shared limiter storage so counts hold across workers, e.g. redis://localhost:6379/1
+    # (requires the redis package). memory:// keeps per-process counts.
+    rate_limit_storage_uri: str = "memory://"
 
     @property
     def max_file_size_bytes(self) -> int:
@@ -9,6 +9,8 @@ from app.core.exceptions import (
     UnauthorizedError,
 )
 from app.core.security import (
+    aget_password_hash,
+    averify_password,
     create_access_token,
     create_refresh_token,
     get_password_hash,
@@ -27,5 +29,7 @@ __all__ = [
     "create_refresh_token",
     "verify_password",
     "get_password_hash",
+    "averify_password",
+    "aget_password_hash",
     "verify_token",
 ]
@@ -3,15 +3,63 @@
 SECURITY: Logs security-relevant events for monitoring and incident response.
 """
 
+import json
 import logging
+import os
+import queue
 from datetime import datetime, timezone
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+from time import time as _time
 from typing import Optional
 from uuid import UUID
 
+from app.core.jsonutil import dumps
+
 # Configure security audit logger
 security_logger = logging.getLogger("security.audit")
 
+# Audit records are handed to a background thread through a queue, so request
+# handlers only pay for an enqueue rather than the stderr write.
+_audit_output = logging.StreamHandler()
+_audit_output.setFormatter(logging.Formatter("%(message)s"))
+_audit_handler = QueueHandler(queue.SimpleQueue())
+_audit_listener: QueueListener
+_audit_listener_running = False
+
+security_logger.addHandler(_audit_handler)
+security_logger.propagate = False
+
+
+def _start_audit_listener() -> None:
+    """Point the audit handler at a fresh queue and start its writer thread."""
+    global _audit_listener, _audit_listener_running
+    audit_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _audit_handler.queue = audit_queue
+    _audit_listener = QueueListener(audit_queue, _audit_output, respect_handler_level=True)
+    _audit_listener.start()
+    _audit_listener_running = True
+
+
+_start_audit_listener()
+
+# Threads do not survive fork. Gunicorn preloads the app in the master, so
+# each worker starts its own writer on a new queue as soon as it is forked;
+# records the master queued before the fork are still written by the master.
+os.register_at_fork(after_in_child=_start_audit_listener)
+
+# Bound once so the hot path skips the attribute lookups on every event
+_audit_log = security_logger.log
+_audit_isenabled = security_logger.isEnabledFor
+
+
+def stop_audit_listener() -> None:
+    """Flush queued audit records and stop the writer thread."""
+    global _audit_listener_running
+    if _audit_listener_running:
+        _audit_listener.stop()
+        _audit_listener_running = False
+
 
 class AuditEvent(str, Enum):
     """Security audit event types."""
@@ -52,6 +100,62 @@ class AuditEvent(str, Enum):
     FILE_VALIDATION_FAILED = "file_validation_failed"
 
 
+# Plain string value of each event, so records don't go through the enum descriptor
+_EVENT_STR = {event: event.value for event in AuditEvent}
+
+# Events logged at WARNING even when the action itself succeeded
+_WARN_EVENTS = frozenset({
+    AuditEvent.LOGIN_FAILED,
+    AuditEvent.UNAUTHORIZED_ACCESS,
+    AuditEvent.INVALID_TOKEN,
+    AuditEvent.WEBHOOK_SIGNATURE_INVALID,
+    AuditEvent.FILE_VALIDATION_FAILED,
+    AuditEvent.RATE_LIMIT_EXCEEDED,
+    AuditEvent.OAUTH_LINK_BLOCKED,
+})
+
+
+# event_type strings accepted by log_password_reset / log_oauth_event
+_PASSWORD_RESET_EVENT_MAP = {
+    "request": AuditEvent.PASSWORD_RESET_REQUEST,
+    "success": AuditEvent.PASSWORD_RESET_SUCCESS,
+    "failed": AuditEvent.PASSWORD_RESET_FAILED,
+}
+_OAUTH_EVENT_MAP = {
+    "login": AuditEvent.OAUTH_LOGIN,
+    "created": AuditEvent.OAUTH_ACCOUNT_CREATED,
+    "blocked": AuditEvent.OAUTH_LINK_BLOCKED,
+}
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def _iso_now() -> str:
+    """Return the current UTC time in ISO-8601 with microseconds.
+
+    The date/time part only changes once per second, so it is formatted once
+    and reused; each call just appends the fractional part.
+    """
+    global _iso_second_cache
+    now = _time()
+    second = int(now)
+    cached_second, prefix = _iso_second_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_second_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}+00:00"
+
+
+def _mask_email(email: str) -> str:
+    """Mask an email for privacy in logs (show first 2 chars and domain)."""
+    local, sep, domain = email.rpartition("@")
+    if not sep:
+        return "***"
+    prefix_len = 2 if len(local) > 2 else 1
+    return local[:prefix_len] + "***@" + domain
+
+
 def log_security_event(
     event: AuditEvent,
     user_id: Optional[UUID] = None,
@@ -73,43 +177,43 @@ def log_security_event(
         details: Additional event details
         success: Whether the action was successful
     """
+    # Use appropriate log level based on event type and success
+    level = logging.WARNING if not success or event in _WARN_EVENTS else logging.INFO
+
+    # Skip building the record entirely when this level is filtered out
+    if not _audit_isenabled(level):
+        return
+
     log_data = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "event": event.value,
+        "timestamp": _iso_now(),
+        "event": _EVENT_STR[event],
         "success": success,
     }
 
     if user_id:
-        log_data["user_id"] = str(user_id)
+        # Serialized as the standard dashed form by dumps
+        log_data["user_id"] = user_id
     if email:
-        # Mask email for privacy in logs (show first 2 chars and domain)
-        if "@" in email:
-            local, domain = email.split("@", 1)
-            masked = f"{local[:2]}***@{domain}" if len(local) > 2 else f"{local[0]}***@{domain}"
-            log_data["email"] = masked
-        else:
-            log_data["email"] = "***"
+        log_data["email"] = _mask_email(email)
     if ip_address:
         log_data["ip_address"] = ip_address
     if user_agent:
         # Truncate user agent for log readability
-        log_data["user_agent"] = user_agent[:100] if len(user_agent) > 100 else user_agent
+        log_data["user_agent"] = user_agent[:100]
     if details:
         log_data["details"] = details
 
-    # Use appropriate log level based on event type and success
-    if not success or event in [
-        AuditEvent.LOGIN_FAILED,
-        AuditEvent.UNAUTHORIZED_ACCESS,
-        AuditEvent.INVALID_TOKEN,
-        AuditEvent.WEBHOOK_SIGNATURE_INVALID,
-        AuditEvent.FILE_VALIDATION_FAILED,
-        AuditEvent.RATE_LIMIT_EXCEEDED,
-        AuditEvent.OAUTH_LINK_BLOCKED,
-    ]:
-        security_logger.warning(f"SECURITY_AUDIT: {log_data}")
-    else:
-        security_logger.info(f"SECURITY_AUDIT: {log_data}")
+    try:
+        record = dumps(log_data, default=str)
+    except TypeError:
+        # orjson rejects non-str keys and ints beyond 64 bits in caller details;
+        # an audit call must never fail the request it is logging
+        try:
+            record = json.dumps(log_data, default=str)
+        except (TypeError, ValueError):
+            record = repr(log_data)
+
+    _audit_log(level, "SECURITY_AUDIT: %s", record)
 
 
 def log_login_attempt(
@@ -143,12 +247,7 @@ def log_password_reset(
     success: bool = True,
 ) -> None:
     """Log password reset events."""
-    event_map = {
-        "request": AuditEvent.PASSWORD_RESET_REQUEST,
-        "success": AuditEvent.PASSWORD_RESET_SUCCESS,
-        "failed": AuditEvent.PASSWORD_RESET_FAILED,
-    }
-    event = event_map.get(event_type, AuditEvent.PASSWORD_RESET_REQUEST)
+    event = _PASSWORD_RESET_EVENT_MAP.get(event_type, AuditEvent.PASSWORD_RESET_REQUEST)
 
     log_security_event(
         event=event,
@@ -167,12 +266,7 @@ def log_oauth_event(
     blocked_reason: Optional[str] = None,
 ) -> None:
     """Log OAuth authentication events."""
-    event_map = {
-        "login": AuditEvent.OAUTH_LOGIN,
-        "created": AuditEvent.OAUTH_ACCOUNT_CREATED,
-        "blocked": AuditEvent.OAUTH_LINK_BLOCKED,
-    }
-    event = event_map.get(event_type, AuditEvent.OAUTH_LOGIN)
+    event = _OAUTH_EVENT_MAP.get(event_type, AuditEvent.OAUTH_LOGIN)
 
     details = {"provider": provider}
     if blocked_reason:
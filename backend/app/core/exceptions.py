@@ -4,16 +4,24 @@ from typing import Any
 
 
 class ToolHubException(Exception):
-    """Base exception for ToolHub application."""
+    """Base exception for ToolHub application.
+
+    Subclasses only override the class-level default_message and status_code;
+    they all share this __init__.
+    """
+
+    default_message: str = "An error occurred"
+    status_code: int = 500
 
     def __init__(
         self,
-        message: str = "An error occurred",
-        status_code: int = 500,
+        message: str | None = None,
+        status_code: int | None = None,
         details: dict[str, Any] | None = None,
     ):
-        self.message = message
-        self.status_code = status_code
+        self.message = message if message is not None else self.default_message
+        if status_code is not None:
+            self.status_code = status_code
         self.details = details or {}
         super().__init__(self.message)
 
@@ -21,70 +29,54 @@ class ToolHubException(Exception):
 class BadRequestError(ToolHubException):
     """400 Bad Request."""
 
-    def __init__(self, message: str = "Bad request", details: dict[str, Any] | None = None):
-        super().__init__(message=message, status_code=400, details=details)
+    default_message = "Bad request"
+    status_code = 400
 
 
 class UnauthorizedError(ToolHubException):
     """401 Unauthorized."""
 
-    def __init__(self, message: str = "Unauthorized", details: dict[str, Any] | None = None):
-        super().__init__(message=message, status_code=401, details=details)
+    default_message = "Unauthorized"
+    status_code = 401
 
 
 class ForbiddenError(ToolHubException):
     """403 Forbidden."""
 
-    def __init__(self, message: str = "Forbidden", details: dict[str, Any] | None = None):
-        super().__init__(message=message, status_code=403, details=details)
+    default_message = "Forbidden"
+    status_code = 403
 
 
 class NotFoundError(ToolHubException):
     """404 Not Found."""
 
-    def __init__(self, message: str = "Not found", details: dict[str, Any] | None = None):
-        super().__init__(message=message, status_code=404, details=details)
+    default_message = "Not found"
+    status_code = 404
 
 
 class RateLimitError(ToolHubException):
     """429 Too Many Requests."""
 
-    def __init__(
-        self,
-        message: str = "Rate limit exceeded",
-        details: dict[str, Any] | None = None,
-    ):
-        super().__init__(message=message, status_code=429, details=details)
+    default_message = "Rate limit exceeded"
+    status_code = 429
 
 
 class PaymentRequiredError(ToolHubException):
     """402 Payment Required."""
 
-    def __init__(
-        self,
-        message: str = "Payment required",
-        details: dict[str, Any] | None = None,
-    ):
-        super().__init__(message=message, status_code=402, details=details)
+    default_message = "Payment required"
+    status_code = 402
 
 
 class UsageLimitError(ToolHubException):
     """Usage limit exceeded (maps to 402)."""
 
-    def __init__(
-        self,
-        message: str = "Daily usage limit exceeded. Please upgrade your plan.",
-        details: dict[str, Any] | None = None,
-    ):
-        super().__init__(message=message, status_code=402, details=details)
+    default_message = "Daily usage limit exceeded. Please upgrade your plan."
+    status_code = 402
 
 
 class FileProcessingError(ToolHubException):
     """Error during file processing."""
 
-    def __init__(
-        self,
-        message: str = "File processing failed",
-        details: dict[str, Any] | None = None,
-    ):
-        super().__init__(message=message, status_code=422, details=details)
+    default_message = "File processing failed"
+    status_code = 422
@@ -55,6 +55,33 @@ FILE_SIGNATURES = {
     ],
 }
 
+# Offset-0 signatures mapped to their type, in FILE_SIGNATURES order so the first
+# type listed wins for shared signatures (jpeg over jpg, xlsx over docx)
+_OFFSET0_SIGS: dict[bytes, str] = {}
+# Signatures that sit past the start of the file, as (signature, offset, type)
+_OFFSET_SIGS: list[tuple[bytes, int, str]] = []
+for _file_type, _signatures in FILE_SIGNATURES.items():
+    if _file_type == "webp":  # Validated separately by _validate_webp
+        continue
+    for _signature, _offset in _signatures:
+        if _offset == 0:
+            _OFFSET0_SIGS.setdefault(_signature, _file_type)
+        else:
+            _OFFSET_SIGS.append((_signature, _offset, _file_type))
+
+# Offset-0 signatures bucketed by their first byte, so detection does one list
+# index and only confirms the few signatures that can possibly match
+_DISPATCH: list[tuple[tuple[bytes, str], ...]] = [()] * 256
+for _signature, _file_type in _OFFSET0_SIGS.items():
+    _DISPATCH[_signature[0]] += ((_signature, _file_type),)
+
+# Offset-0 signatures per type, so validation is a single bytes.startswith call
+_STARTSWITH_TUPLES: dict[str, tuple[bytes, ...]] = {
+    file_type: tuple(signature for signature, offset in signatures if offset == 0)
+    for file_type, signatures in FILE_SIGNATURES.items()
+}
+
+
 # Additional validation for WebP (needs to check WEBP at offset 8)
 def _validate_webp(content: bytes) -> bool:
     """Validate WebP file by checking both RIFF header and WEBP marker."""
@@ -91,12 +118,14 @@ def validate_file_signature(content: bytes, expected_type: str) -> bool:
         # Unknown type - be permissive but log warning
         return True
 
-    signatures = FILE_SIGNATURES[expected_type]
+    prefixes = _STARTSWITH_TUPLES[expected_type]
+    if prefixes:
+        return content.startswith(prefixes)
 
-    for signature, offset in signatures:
-        if len(content) >= offset + len(signature):
-            if content[offset:offset + len(signature)] == signature:
-                return True
+    # Types whose signatures sit past the start of the file (e.g. HEIC ftyp box)
+    for signature, offset in FILE_SIGNATURES[expected_type]:
+        if content.startswith(signature, offset):
+            return True
 
     return False
 
@@ -119,13 +148,13 @@ def get_file_type_from_content(content: bytes) -> Optional[str]:
         return "webp"
 
     # Check other types
-    for file_type, signatures in FILE_SIGNATURES.items():
-        if file_type == "webp":  # Skip, already checked
-            continue
-        for signature, offset in signatures:
-            if len(content) >= offset + len(signature):
-                if content[offset:offset + len(signature)] == signature:
-                    return file_type
+    for signature, file_type in _DISPATCH[content[0]]:
+        if content.startswith(signature):
+            return file_type
+
+    for signature, offset, file_type in _OFFSET_SIGS:
+        if content.startswith(signature, offset):
+            return file_type
 
     return None
 
@@ -156,6 +185,11 @@ def validate_image_file(content: bytes, content_type: Optional[str] = None) -> t
     return True, detected_type
 
 
+def _has_trailer(content: bytes, marker: bytes, window: int = 1024) -> bool:
+    """Check whether marker appears within the last `window` bytes, without slicing."""
+    return content.rfind(marker, max(0, len(content) - window)) != -1
+
+
 def validate_pdf_file(content: bytes) -> tuple[bool, str]:
     """
     Validate that content is a valid PDF file.
@@ -172,7 +206,7 @@ def validate_pdf_file(content: bytes) -> tuple[bool, str]:
         return False, "Invalid PDF file: file signature does not match"
 
     # Additional check: PDF should also contain %%EOF marker
-    if b"%%EOF" not in content[-1024:]:  # Check last 1KB
+    if not _has_trailer(content, b"%%EOF"):  # Check last 1KB
         return False, "Invalid PDF file: missing EOF marker"
 
     return True, "Valid PDF"
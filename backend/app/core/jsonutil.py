@@ -0,0 +1,30 @@
+"""Compact JSON encoding, using orjson when it is installed.
+
+For dicts with str keys whose values are strings, bools, None, ints that fit
+in 64 bits, and lists or dicts of those, both paths produce the same bytes: no
+whitespace, and non-ASCII characters written as UTF-8 rather than \\u escapes.
+JWT claims stay within that subset, so signatures do not depend on whether
+orjson is present. Outside it the paths differ: floats may be formatted
+differently (1e+16 vs 1e16), NaN becomes null under orjson, and orjson raises
+TypeError on non-str keys and on ints beyond 64 bits.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+
+    def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Serialize obj to compact UTF-8 JSON."""
+        return orjson.dumps(obj, default=default)
+except ImportError:
+
+    def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Serialize obj to compact UTF-8 JSON."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default).encode()
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize obj to a compact JSON string."""
+    return dumps_bytes(obj, default).decode()
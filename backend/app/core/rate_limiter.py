@@ -1,4 +1,4 @@
-"""Rate limiting configuration using slowapi with in-memory storage.
+"""Rate limiting configuration using slowapi.
 
 SECURITY: Implements tiered rate limiting to prevent abuse while allowing
 legitimate usage. More expensive operations have stricter limits.
@@ -15,29 +15,31 @@ from app.config import settings
 def get_user_or_ip(request) -> str:
     """Get user ID if authenticated, otherwise IP address."""
     # Try to get user from request state (set by auth middleware)
-    if hasattr(request.state, "user") and request.state.user:
-        return f"user:{request.state.user.id}"
+    user = getattr(request.state, "user", None)
+    if user:
+        return f"user:{user.id}"
     return get_remote_address(request)
 
 
 def get_tier_aware_key(request) -> str:
     """Get a key that includes tier information for differentiated rate limiting."""
-    base_key = get_user_or_ip(request)
-    # Check if user has pro subscription
-    if hasattr(request.state, "user") and request.state.user:
-        if hasattr(request.state, "subscription_tier"):
-            tier = request.state.subscription_tier
-        else:
-            tier = "free"
-        return f"{tier}:{base_key}"
-    return f"anon:{base_key}"
-
-
-# Create limiter with in-memory storage (default)
+    state = request.state
+    user = getattr(state, "user", None)
+    if user:
+        # Check if user has pro subscription
+        tier = getattr(state, "subscription_tier", "free")
+        return f"{tier}:user:{user.id}"
+    return f"anon:{get_remote_address(request)}"
+
+
+# Create limiter. With several workers, point RATE_LIMIT_STORAGE_URI at Redis so
+# limits are shared instead of multiplied per process; if Redis is unreachable
+# slowapi falls back to in-memory counting rather than failing requests.
 limiter = Limiter(
     key_func=get_user_or_ip,
     default_limits=[f"{settings.rate_limit_per_minute}/minute"],
-    storage_uri="memory://",
+    storage_uri=settings.rate_limit_storage_uri,
+    in_memory_fallback_enabled=not settings.rate_limit_storage_uri.startswith("memory://"),
 )
 
 
@@ -90,6 +92,26 @@ TOOL_RATE_LIMIT = TOOL_RATE_LIMIT_FREE
 ADMIN_RATE_LIMIT = "60/minute"
 
 
+# Rate limit by (tier, limit_type); anonymous users get free-tier limits
+_TIER_LIMITS: dict[tuple[str, str], str] = {
+    ("pro", "pdf"): PDF_RATE_LIMIT_PRO,
+    ("pro", "image"): IMAGE_RATE_LIMIT_PRO,
+    ("pro", "image_batch"): IMAGE_BATCH_RATE_LIMIT_PRO,
+    ("pro", "tool"): TOOL_RATE_LIMIT_PRO,
+    ("pro", "webpdf"): WEBPDF_RATE_LIMIT_PRO,
+    ("free", "pdf"): PDF_RATE_LIMIT_FREE,
+    ("free", "image"): IMAGE_RATE_LIMIT_FREE,
+    ("free", "image_batch"): IMAGE_BATCH_RATE_LIMIT_FREE,
+    ("free", "tool"): TOOL_RATE_LIMIT_FREE,
+    ("free", "webpdf"): WEBPDF_RATE_LIMIT_FREE,
+    ("anon", "pdf"): PDF_RATE_LIMIT_FREE,
+    ("anon", "image"): IMAGE_RATE_LIMIT_FREE,
+    ("anon", "image_batch"): IMAGE_BATCH_RATE_LIMIT_FREE,
+    ("anon", "tool"): TOOL_RATE_LIMIT_FREE,
+    ("anon", "webpdf"): WEBPDF_RATE_LIMIT_FREE,
+}
+
+
 def get_rate_limit_for_tier(tier: str, limit_type: str) -> str:
     """Get the appropriate rate limit string based on user tier.
 
@@ -100,29 +122,8 @@ def get_rate_limit_for_tier(tier: str, limit_type: str) -> str:
     Returns:
         Rate limit string like "10/minute"
     """
-    limits = {
-        "pro": {
-            "pdf": PDF_RATE_LIMIT_PRO,
-            "image": IMAGE_RATE_LIMIT_PRO,
-            "image_batch": IMAGE_BATCH_RATE_LIMIT_PRO,
-            "tool": TOOL_RATE_LIMIT_PRO,
-            "webpdf": WEBPDF_RATE_LIMIT_PRO,
-        },
-        "free": {
-            "pdf": PDF_RATE_LIMIT_FREE,
-            "image": IMAGE_RATE_LIMIT_FREE,
-            "image_batch": IMAGE_BATCH_RATE_LIMIT_FREE,
-            "tool": TOOL_RATE_LIMIT_FREE,
-            "webpdf": WEBPDF_RATE_LIMIT_FREE,
-        },
-        "anon": {
-            "pdf": PDF_RATE_LIMIT_FREE,
-            "image": IMAGE_RATE_LIMIT_FREE,
-            "image_batch": IMAGE_BATCH_RATE_LIMIT_FREE,
-            "tool": TOOL_RATE_LIMIT_FREE,
-            "webpdf": WEBPDF_RATE_LIMIT_FREE,
-        },
-    }
-
-    tier_limits = limits.get(tier, limits["free"])
-    return tier_limits.get(limit_type, TOOL_RATE_LIMIT_FREE)
+    limit = _TIER_LIMITS.get((tier, limit_type))
+    if limit is None:
+        # Unknown tier falls back to free; unknown limit type to the general tool limit
+        limit = _TIER_LIMITS.get(("free", limit_type), TOOL_RATE_LIMIT_FREE)
+    return limit
@@ -1,6 +1,15 @@
 """Security utilities - JWT, password hashing, OAuth."""
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Any
 
 from jose import JWTError, jwt
@@ -8,11 +17,63 @@ from passlib.context import CryptContext
 
 from app.config import settings
 from app.core.exceptions import UnauthorizedError
+from app.core.jsonutil import dumps_bytes
 
 # Password hashing context
 # Using bcrypt as default (user preference)
 pwd_context = CryptContext(schemes=["bcrypt", "argon2"], deprecated="auto")
 
+# bcrypt hash (default 12 rounds) of a throwaway password. Login verifies
+# against it when the account does not exist, so the response takes as long
+# as a real password check and does not reveal which emails are registered.
+DUMMY_PASSWORD_HASH = "$2b$12$hA58pZimuz.23qwWLNpAFOOKX1a.3DzcWwMAOyeewKUeO4Og0L/Wa"
+
+# Dedicated pool for password hashing so bcrypt never blocks the event loop
+_bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="bcrypt")
+
+# Recently verified tokens, keyed by (token, token_type). Tokens are stateless
+# and carry their own expiry, so a hit only needs the exp claim re-checked.
+VERIFIED_TOKEN_CACHE_SIZE = 4096
+_verified_tokens: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWS requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Constant HS256 header and key, serialized the same way python-jose does
+_JWT_HEADER_B64 = _b64url(
+    json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":"), sort_keys=True).encode()
+)
+_SIGNING_KEY = settings.secret_key.encode()
+
+# Default token lifetimes in seconds; exp is stored as integer epoch seconds,
+# the same value jose derives from a datetime
+_ACCESS_TOKEN_TTL = settings.access_token_expire_minutes * 60
+_REFRESH_TOKEN_TTL = settings.refresh_token_expire_days * 86400
+
+
+def _fast_hs256_encode(payload: dict[str, Any]) -> str:
+    """Encode an HS256 JWT directly with hmac, skipping jose's per-call setup.
+
+    For ASCII claims the output is byte-for-byte what jwt.encode produces;
+    non-ASCII characters are written as UTF-8 instead of \\u escapes.
+    """
+    exp = payload.get("exp")
+    if isinstance(exp, datetime):
+        payload["exp"] = int(exp.timestamp())
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(dumps_bytes(payload))
+    signature = hmac.new(_SIGNING_KEY, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
+
+def _encode_token(payload: dict[str, Any]) -> str:
+    """Sign a token, using the hmac fast path for HS256."""
+    if settings.algorithm == "HS256":
+        return _fast_hs256_encode(payload)
+    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
@@ -24,17 +85,29 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _bcrypt_pool, pwd_context.verify, plain_password, hashed_password
+    )
+
+
+async def aget_password_hash(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _bcrypt_pool, pwd_context.hash, password
+    )
+
+
 def create_access_token(
     data: dict[str, Any],
     expires_delta: timedelta | None = None,
 ) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (
-        expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
-    )
-    to_encode.update({"exp": expire, "type": "access"})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    ttl = expires_delta.total_seconds() if expires_delta else _ACCESS_TOKEN_TTL
+    to_encode.update({"exp": int(time.time() + ttl), "type": "access"})
+    return _encode_token(to_encode)
 
 
 def create_refresh_token(
@@ -43,23 +116,36 @@ def create_refresh_token(
 ) -> str:
     """Create a JWT refresh token."""
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (
-        expires_delta or timedelta(days=settings.refresh_token_expire_days)
-    )
-    to_encode.update({"exp": expire, "type": "refresh"})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    ttl = expires_delta.total_seconds() if expires_delta else _REFRESH_TOKEN_TTL
+    to_encode.update({"exp": int(time.time() + ttl), "type": "refresh"})
+    return _encode_token(to_encode)
 
 
 def verify_token(token: str, token_type: str = "access") -> dict[str, Any]:
     """Verify and decode a JWT token."""
+    key = (token, token_type)
+    cached = _verified_tokens.get(key)
+    if cached is not None:
+        if cached.get("exp", 0) > time.time():
+            _verified_tokens.move_to_end(key)
+            return dict(cached)
+        # Expired since it was cached - let jwt.decode produce the error
+        _verified_tokens.pop(key, None)
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
         if payload.get("type") != token_type:
             raise UnauthorizedError(message="Invalid token type")
-        return payload
     except JWTError as e:
         raise UnauthorizedError(message="Invalid or expired token") from e
 
+    # Only tokens with an expiry are cached, so a hit can always be re-validated
+    if isinstance(payload.get("exp"), (int, float)):
+        _verified_tokens[key] = payload
+        if len(_verified_tokens) > VERIFIED_TOKEN_CACHE_SIZE:
+            _verified_tokens.popitem(last=False)
+    return dict(payload)
+
 
 def create_email_verification_token(email: str) -> str:
     """Create token for email verification."""
@@ -1,5 +1,5 @@
 """Database module."""
 
-from app.db.session import get_session, init_db
+from app.db.session import get_session, init_db, schema_exists
 
-__all__ = ["get_session", "init_db"]
+__all__ = ["get_session", "init_db", "schema_exists"]
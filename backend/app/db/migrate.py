@@ -0,0 +1,24 @@
+"""One-shot schema migration: `python -m app.db.migrate`.
+
+Run once per deploy (e.g. before starting Gunicorn) instead of creating tables
+from every worker at startup.
+"""
+
+import os
+
+from alembic import command
+from alembic.config import Config
+
+# alembic.ini lives in the backend root, two levels above this package
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def upgrade_to_head() -> None:
+    """Apply all pending Alembic migrations."""
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    upgrade_to_head()
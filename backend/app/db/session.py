@@ -2,32 +2,94 @@
 
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
 from sqlmodel import SQLModel
 
 from app.config import settings
 
+# asyncpg connection tuning: short OLTP queries don't benefit from PostgreSQL's
+# JIT, and larger statement caches keep prepared plans for our hot queries
+_connect_args = {}
+if settings.database_url.startswith("postgresql+asyncpg"):
+    _connect_args = {
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+    }
+
 # Create async engine with optimized connection pool
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
-    pool_pre_ping=True,
+    # No pre-ping: it costs a round trip on every checkout. A connection that
+    # died with the server fails its first query, and SQLAlchemy then
+    # invalidates the rest of the pool
+    pool_pre_ping=False,
     pool_size=20,  # Increased from 5 for better concurrency
     max_overflow=20,  # Increased from 10 to handle traffic spikes
     pool_recycle=3600,  # Recycle connections every hour to prevent stale connections
+    pool_use_lifo=True,  # Reuse the most recent connection so a warm subset stays hot
+    connect_args=_connect_args,
 )
 
+
+class _WriteTrackingSession(Session):
+    """Session that records in info["has_writes"] whether it wrote anything."""
+
+
+@event.listens_for(_WriteTrackingSession, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(_WriteTrackingSession, "do_orm_execute")
+def _mark_write_statement(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(_WriteTrackingSession, "after_commit")
+def _clear_writes(session: Session) -> None:
+    session.info.pop("has_writes", None)
+
+
 # Create async session factory
 async_session_factory = sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=_WriteTrackingSession,
     expire_on_commit=False,
     autoflush=False,
 )
 
 
+def _has_pending_writes(session: AsyncSession) -> bool:
+    """Check whether the session has unflushed changes or has already written."""
+    return bool(
+        session.new
+        or session.dirty
+        or session.deleted
+        or session.info.get("has_writes")
+    )
+
+
+# Set once the schema is known to exist, so later checks skip the round trip
+_schema_ready = False
+
+
+async def schema_exists() -> bool:
+    """Check whether the application tables already exist (one cheap query)."""
+    global _schema_ready
+    if not _schema_ready:
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT to_regclass('public.users')"))
+            _schema_ready = result.scalar() is not None
+    return _schema_ready
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     # Import models to ensure they are registered with SQLModel.metadata
@@ -37,11 +99,18 @@ async def init_db() -> None:
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session dependency."""
+    """Get database session dependency.
+
+    Commits on exit only when the request wrote something; read-only requests
+    just end their transaction, saving the COMMIT round trip.
+    """
     async with async_session_factory() as session:
         try:
             yield session
-            await session.commit()
+            if _has_pending_writes(session):
+                await session.commit()
+            elif session.in_transaction():
+                await session.rollback()
         except Exception:
             await session.rollback()
             raise
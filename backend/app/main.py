@@ -1,107 +1,283 @@
 """FastAPI application entry point."""
 
+import asyncio
 import hmac
+import json
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from fastapi import FastAPI, Request, Response
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.cors import ALL_METHODS
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from fastapi import Header
 
 from app.api.deps import DbSession
+from app.api.v1.tools.text_diff import warm_jit_bisect
 from app.api.v1.router import router as api_router
 from app.config import settings
+from app.core.audit import stop_audit_listener
 from app.core.exceptions import ToolHubException, BadRequestError
 from app.core.rate_limiter import limiter
-from app.db.session import init_db, get_session
-from app.workers.cleanup import start_cleanup_scheduler, stop_cleanup_scheduler
+from app.db.session import init_db, get_session, schema_exists
+from app.services.email_service import email_service
+from app.workers.preload import preload_once
+from app.workers.usage_writer import usage_writer
+from app.workers.visit_writer import visit_writer
 
+logger = logging.getLogger(__name__)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to all responses.
+# Settings read on hot paths, frozen once at import
+IS_PROD = settings.is_production
+DEBUG = settings.debug
+APP_NAME = settings.app_name
+APP_VERSION = settings.app_version
+ENVIRONMENT = settings.environment
+
+# Create temp directory once at import. Gunicorn preloads the app, so this runs
+# in the master before fork rather than in every worker's lifespan.
+os.makedirs(settings.temp_file_dir, exist_ok=True)
+
+
+def _json_bytes(value) -> bytes:
+    """Serialize like Starlette's JSONResponse (compact, UTF-8)."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Health and root bodies are static apart from the timestamp, so serialize them once
+_ROOT_BODY = _json_bytes({
+    "name": APP_NAME,
+    "version": APP_VERSION,
+    "docs": "/docs" if DEBUG else "Disabled in production",
+})
+_HEALTH_PREFIX = b'{"status":"healthy","version":' + _json_bytes(APP_VERSION) + b',"timestamp":"'
+_HEALTH_SUFFIX = b'","environment":' + _json_bytes(ENVIRONMENT) + b"}"
+
+
+@lru_cache(maxsize=256)
+def _error_body(message: str) -> bytes:
+    """Encoded body of a ToolHubException without details.
+
+    Most errors carry a fixed message ("Invalid email or password", ...), so
+    repeat failures reuse the bytes instead of serializing them again.
+    """
+    return _json_bytes({"message": message, "success": False, "details": {}})
+
+
+# Security headers are static, so encode them once at import as raw ASGI pairs
+_SEC_RAW: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"SAMEORIGIN"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+)
+_SEC_RAW_PROD = _SEC_RAW + (
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+)
+# Relaxed CSP - allow all connections for easier cross-origin work
+_CSP_PAIR = (
+    b"content-security-policy",
+    b"default-src * 'unsafe-inline' 'unsafe-eval' data: blob:; "
+    b"frame-ancestors 'self' *; "
+    b"object-src 'none'",
+)
+# Swagger UI docs load assets from cdn.jsdelivr.net, so they skip the CSP
+_DOCS_PATHS = frozenset({"/docs", "/redoc", "/openapi.json"})
+
+
+# Preflight response headers that do not depend on the request
+_PREFLIGHT_VARY = (
+    "Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+    "Access-Control-Request-Private-Network"
+)
+_PREFLIGHT_METHODS = ", ".join(ALL_METHODS)
+_PREFLIGHT_MAX_AGE = "600"
+
+_VARY_ORIGIN = (b"vary", b"Origin")
+
+
+class CorsAndSecurityMiddleware:
+    """Handle CORS and add security headers to all responses in one layer.
+
+    CORS follows Starlette's CORSMiddleware with every method and header
+    allowed. Requests without an Origin header, or whose Origin matches the
+    Host, need no CORS headers and only get ``Vary: Origin`` for caches.
 
     SECURITY: These headers protect against various web vulnerabilities:
     - X-Content-Type-Options: Prevents MIME type sniffing
     - X-Frame-Options: Prevents clickjacking
-    - X-XSS-Protection: Basic XSS protection (legacy browsers)
     - Referrer-Policy: Controls referrer information
     - Content-Security-Policy: Controls resource loading
-    """
+    - Strict-Transport-Security: Forces HTTPS (production only)
 
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
+    X-XSS-Protection is no longer sent: modern browsers ignore it and CSP
+    covers the same ground.
 
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "SAMEORIGIN"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+    Implemented as plain ASGI middleware that edits the response start message
+    once, instead of stacking a CORS wrapper on top of a security one.
+    """
 
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        origins: frozenset[str],
+        allow_credentials: bool,
+        csp: tuple[bytes, bytes],
+        prod: bool,
+        docs_paths: frozenset[str],
+    ):
+        self.app = app
+        self.allow_all_origins = "*" in origins
+        self.allow_credentials = allow_credentials
+        self.origins = frozenset(o.encode("latin-1") for o in origins)
+        self.csp = csp
+        self.docs_paths = docs_paths
         # Only add HSTS in production (requires HTTPS)
-        if settings.is_production:
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        # Skip strict CSP for Swagger UI docs (they load assets from cdn.jsdelivr.net)
-        is_docs_route = request.url.path in ("/docs", "/redoc", "/openapi.json")
-        if not is_docs_route:
-            # Relaxed CSP - allow all connections for easier cross-origin work
-            response.headers["Content-Security-Policy"] = (
-                "default-src * 'unsafe-inline' 'unsafe-eval' data: blob:; "
-                "frame-ancestors 'self' *; "
-                "object-src 'none'"
+        self._sec_raw = _SEC_RAW_PROD if prod else _SEC_RAW
+        # Wildcard origins with credentials must echo the request origin
+        self._echo_any_origin = self.allow_all_origins and allow_credentials
+        self._cors_raw: tuple[tuple[bytes, bytes], ...] = (
+            ((b"access-control-allow-credentials", b"true"),) if allow_credentials else ()
+        )
+
+    def _is_allowed_origin(self, origin: bytes) -> bool:
+        return self.allow_all_origins or origin in self.origins
+
+    def _preflight_response(self, origin: bytes, headers: dict[bytes, bytes]) -> Response:
+        """Answer a CORS preflight the way CORSMiddleware does."""
+        response_headers = {"Vary": _PREFLIGHT_VARY}
+        if not self.allow_credentials and self.allow_all_origins:
+            response_headers["Access-Control-Allow-Origin"] = "*"
+        response_headers["Access-Control-Allow-Methods"] = _PREFLIGHT_METHODS
+        response_headers["Access-Control-Max-Age"] = _PREFLIGHT_MAX_AGE
+        if self.allow_credentials:
+            response_headers["Access-Control-Allow-Credentials"] = "true"
+
+        failures = []
+        if self._is_allowed_origin(origin):
+            if self.allow_credentials or not self.allow_all_origins:
+                response_headers["Access-Control-Allow-Origin"] = origin.decode("latin-1")
+        else:
+            failures.append("origin")
+
+        if headers[b"access-control-request-method"].decode("latin-1") not in ALL_METHODS:
+            failures.append("method")
+
+        # All headers are allowed, so mirror back whatever was requested
+        requested_headers = headers.get(b"access-control-request-headers")
+        if requested_headers is not None:
+            response_headers["Access-Control-Allow-Headers"] = requested_headers.decode("latin-1")
+
+        # Private network access is not allowed
+        if b"access-control-request-private-network" in headers:
+            failures.append("private-network")
+
+        if failures:
+            return PlainTextResponse(
+                "Disallowed CORS " + ", ".join(failures),
+                status_code=400,
+                headers=response_headers,
             )
-
-        return response
-
-
-def preload_ml_models():
-    """Pre-load ML models for faster first request."""
-    try:
-        from app.services.tools.image_service import _get_rembg_session
-        _get_rembg_session()
-        print("Pre-loaded rembg model for background removal")
-    except Exception as e:
-        print(f"Warning: Failed to pre-load rembg model: {e}")
+        return PlainTextResponse("OK", status_code=200, headers=response_headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        origin = headers.get(b"origin")
+        if origin is not None and origin.partition(b"://")[2] == headers.get(b"host"):
+            origin = None  # same-origin request
+
+        if (
+            origin is not None
+            and scope["method"] == "OPTIONS"
+            and b"access-control-request-method" in headers
+        ):
+            response = self._preflight_response(origin, headers)
+            await response(scope, receive, send)
+            return
+
+        extra = self._sec_raw
+        if scope["path"] not in self.docs_paths:
+            extra += (self.csp,)
+        if origin is not None:
+            extra += self._cors_raw
+            if self._echo_any_origin or (
+                not self.allow_all_origins and origin in self.origins
+            ):
+                extra += ((b"access-control-allow-origin", origin),)
+            elif self.allow_all_origins:
+                extra += ((b"access-control-allow-origin", b"*"),)
+        extra += (_VARY_ORIGIN,)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = message.setdefault("headers", [])
+                if not isinstance(headers, list):
+                    headers = message["headers"] = list(headers)
+                headers.extend(extra)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
-    print(f"Starting {settings.app_name} v{settings.app_version}")
+    print(f"Starting {APP_NAME} v{APP_VERSION}")
 
-    # Create temp directory
-    os.makedirs(settings.temp_file_dir, exist_ok=True)
+    # Size the default executor used by aiofiles for concurrent file writes
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.file_io_threads)
+    )
 
-    # Initialize database tables (for development)
-    if settings.debug:
+    # Initialize database tables (for development). Deploys run
+    # `python -m app.db.migrate` instead; skip DDL once the schema exists.
+    if DEBUG and not await schema_exists():
         await init_db()
 
-    # Start cleanup scheduler
+    # Start cleanup scheduler (APScheduler is only needed once the app runs)
+    from app.workers.cleanup import start_cleanup_scheduler, stop_cleanup_scheduler
     start_cleanup_scheduler()
 
-    # Pre-load ML models in background (don't block startup)
+    # Start the page visit and usage write-behind consumers
+    visit_writer.start()
+    usage_writer.start()
+
+    # Pre-load ML models in background (don't block startup); only the first
+    # worker to take the preload lock does the work
     import threading
-    threading.Thread(target=preload_ml_models, daemon=True).start()
+    threading.Thread(target=preload_once, daemon=True).start()
+    # Every worker compiles (or loads from numba's cache) its own diff kernel;
+    # large word diffs use the pure-Python kernel until it is ready
+    threading.Thread(target=warm_jit_bisect, daemon=True).start()
 
     yield
 
     # Shutdown
+    await visit_writer.stop()
+    await usage_writer.stop()
     stop_cleanup_scheduler()
-    print(f"Shutting down {settings.app_name}")
+    stop_audit_listener()
+    await email_service.aclose()
+    print(f"Shutting down {APP_NAME}")
 
 
 # Create FastAPI app
 app = FastAPI(
-    title=settings.app_name,
+    title=APP_NAME,
     description="All-in-one productivity suite API",
-    version=settings.app_version,
+    version=APP_VERSION,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
@@ -112,24 +288,17 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# SECURITY: Add security headers middleware
-app.add_middleware(SecurityHeadersMiddleware)
-
-# CORS middleware
+# CORS and security headers middleware
 # If allowed_origins is "*", we set allow_credentials=False as per FastAPI/Starlette requirements.
 # Otherwise, we use the list of origins and allow credentials.
 if "*" in settings.allowed_origins:
-    print("DEBUG: CORS - Allowing ALL origins (credentials=False)")
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=False,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    if DEBUG:
+        logger.debug("CORS - Allowing ALL origins (credentials=False)")
+    cors_origins = frozenset({"*"})
+    cors_allow_credentials = False
 else:
     allowed_origins = list(settings.allowed_origins)
-    if not settings.is_production:
+    if not IS_PROD:
         # Add common development ports if not already present
         dev_origins = [
             "http://localhost:3000", "http://localhost:3001", "http://localhost:3002",
@@ -139,20 +308,31 @@ else:
             if origin not in allowed_origins:
                 allowed_origins.append(origin)
 
-    print(f"DEBUG: Allowed Origins: {allowed_origins}")
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=allowed_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    if DEBUG:
+        logger.debug("Allowed Origins: %s", allowed_origins)
+    cors_origins = frozenset(allowed_origins)
+    cors_allow_credentials = True
+
+app.add_middleware(
+    CorsAndSecurityMiddleware,
+    origins=cors_origins,
+    allow_credentials=cors_allow_credentials,
+    csp=_CSP_PAIR,
+    prod=IS_PROD,
+    docs_paths=_DOCS_PATHS,
+)
 
 
 # Custom exception handler
 @app.exception_handler(ToolHubException)
 async def toolhub_exception_handler(request: Request, exc: ToolHubException):
     """Handle custom ToolHub exceptions."""
+    if not exc.details:
+        return Response(
+            _error_body(exc.message),
+            status_code=exc.status_code,
+            media_type="application/json",
+        )
     return JSONResponse(
         status_code=exc.status_code,
         content={
@@ -167,23 +347,15 @@ async def toolhub_exception_handler(request: Request, exc: ToolHubException):
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": settings.app_version,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "environment": settings.environment,
-    }
+    timestamp = datetime.now(timezone.utc).isoformat().encode()
+    return Response(_HEALTH_PREFIX + timestamp + _HEALTH_SUFFIX, media_type="application/json")
 
 
 # Root endpoint
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "docs": "/docs" if settings.debug else "Disabled in production",
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 # Include API router
@@ -4,6 +4,7 @@ import uuid
 from decimal import Decimal
 from typing import Optional
 
+from pydantic import ConfigDict
 from sqlmodel import Field, SQLModel
 
 from app.models.base import BaseModel
@@ -35,6 +36,8 @@ class Donation(BaseModel, table=True):
 class DonationResponse(SQLModel):
     """Schema for donation response."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: uuid.UUID
     email: str
     name: Optional[str]
@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from pydantic import EmailStr
+from pydantic import ConfigDict
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.models.base import BaseModel
@@ -86,6 +86,8 @@ class FeedbackUpdate(SQLModel):
 class FeedbackResponse(SQLModel):
     """Schema for feedback response."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: uuid.UUID
     type: FeedbackType
     subject: str
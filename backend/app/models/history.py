@@ -1,11 +1,14 @@
 """Usage history database model."""
 
+import json
 import uuid
 from datetime import datetime
+from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import Index
+from sqlalchemy import CheckConstraint, Index
+from pydantic import ConfigDict, field_validator
 from sqlmodel import Column, Field, Relationship, SQLModel
 from sqlalchemy.dialects.postgresql import JSONB, INET
 
@@ -15,6 +18,42 @@ if TYPE_CHECKING:
     from app.models.user import User
 
 
+# Upper bound on the serialized size of each metadata column, enforced by the
+# usage_metadata_size CHECK constraint
+METADATA_MAX_BYTES = 4096
+
+# Stored in place of metadata that exceeds METADATA_MAX_BYTES
+TRUNCATED_METADATA = {"_truncated": True}
+
+
+def _as_jsonb_text(value: Any) -> Any:
+    """
+    Copy of value with every float replaced by the digits Postgres prints for it.
+
+    jsonb stores numbers as numeric, which never uses exponent notation, so
+    1e-300 comes back from jsonb::text as 302 characters. The digits are
+    emitted as strings, so the quotes make the estimate slightly high.
+    """
+    if isinstance(value, float):
+        return format(Decimal(repr(value)), "f")
+    if isinstance(value, dict):
+        return {k: _as_jsonb_text(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_as_jsonb_text(v) for v in value]
+    return value
+
+
+def cap_metadata(value: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    """Replace metadata whose jsonb::text would not fit under METADATA_MAX_BYTES."""
+    if value is None:
+        return value
+    # json.dumps uses the same ", " / ": " separators as jsonb::text and
+    # \u-escapes non-ASCII, which is never shorter than the UTF-8 Postgres prints
+    if len(json.dumps(_as_jsonb_text(value))) < METADATA_MAX_BYTES:
+        return value
+    return dict(TRUNCATED_METADATA)
+
+
 class ToolType(str, Enum):
     """Available tools."""
 
@@ -41,12 +80,22 @@ class UsageHistory(BaseModel, table=True):
 
     # Composite indexes for performance optimization
     __table_args__ = (
-        # Index for user analytics queries (user_id + created_at)
+        # Index for per-user history listings (user_id + created_at)
         Index("ix_usage_history_user_created", "user_id", "created_at"),
-        # Index for tier/tool analytics
-        Index("ix_usage_history_tier_tool_created", "tier_at_use", "tool", "created_at"),
-        # Index for country analytics
-        Index("ix_usage_history_country_created", "country_code", "created_at"),
+        # Block-range index for time-range analytics; rows are appended in
+        # created_at order, so this stays tiny compared to a B-tree
+        Index(
+            "ix_usage_history_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Keep metadata small enough to stay inline instead of being TOASTed
+        CheckConstraint(
+            f"octet_length(input_metadata::text) < {METADATA_MAX_BYTES} "
+            f"AND octet_length(output_metadata::text) < {METADATA_MAX_BYTES}",
+            name="usage_metadata_size",
+        ),
     )
 
     # User (optional - NULL for anonymous)
@@ -96,10 +145,18 @@ class UsageHistoryCreate(SQLModel):
     success: bool = True
     error_message: Optional[str] = None
 
+    @field_validator("input_metadata")
+    @classmethod
+    def cap_input_metadata(cls, v: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        """Truncate oversized metadata."""
+        return cap_metadata(v)
+
 
 class UsageHistoryResponse(SQLModel):
     """Schema for usage history response."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: uuid.UUID
     tool: ToolType
     operation: str
@@ -14,12 +14,15 @@ class PageVisit(BaseModel, table=True):
 
     __tablename__ = "page_visits"
 
-    # Composite indexes for performance optimization
+    # Block-range index for time-range analytics; visits are appended in
+    # created_at order, so this stays tiny compared to a B-tree
     __table_args__ = (
-        # Index for path analytics queries
-        Index("ix_page_visits_path_created", "path", "created_at"),
-        # Index for general analytics
-        Index("ix_page_visits_created", "created_at"),
+        Index(
+            "ix_page_visits_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     # Request info
@@ -37,4 +40,4 @@ class PageVisitCreate(SQLModel):
     """Schema for creating a page visit."""
 
     path: str
-    referrer: Optional[str] = None
+    referrer: Optional[str] = Field(default=None, max_length=500)
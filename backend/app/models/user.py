@@ -4,10 +4,11 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 
-from pydantic import EmailStr
+from pydantic import ConfigDict, EmailStr
 from sqlmodel import Field, Relationship, SQLModel
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, utc_now
+from app.schemas.auth import Email
 
 if TYPE_CHECKING:
     from app.models.history import UsageHistory
@@ -51,7 +52,7 @@ class User(BaseModel, table=True):
     def update_last_login(self, ip_address: str | None = None) -> None:
         """Update last login timestamp and IP."""
         # Use naive datetime (UTC) to match database column type
-        self.last_login_at = datetime.utcnow()
+        self.last_login_at = utc_now()
         if ip_address:
             self.last_login_ip = ip_address
 
@@ -59,7 +60,7 @@ class User(BaseModel, table=True):
 class UserCreate(SQLModel):
     """Schema for creating a user."""
 
-    email: EmailStr
+    email: Email
     full_name: str
     password: str
 
@@ -67,7 +68,7 @@ class UserCreate(SQLModel):
 class UserLogin(SQLModel):
     """Schema for user login."""
 
-    email: EmailStr
+    email: Email
     password: str
 
 
@@ -81,8 +82,10 @@ class UserUpdate(SQLModel):
 class UserResponse(SQLModel):
     """Schema for user response (public data)."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: uuid.UUID
-    email: EmailStr
+    email: Email
     full_name: str
     avatar_url: Optional[str]
     is_verified: bool
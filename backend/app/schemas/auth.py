@@ -1,13 +1,67 @@
 """Authentication schemas."""
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
-import re
+from typing import Annotated
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    EmailStr,
+    Field,
+    TypeAdapter,
+    WithJsonSchema,
+    field_validator,
+)
+
+# One compiled EmailStr validator shared by every schema with an email field,
+# instead of each model building its own email core schema
+EMAIL_ADAPTER = TypeAdapter(EmailStr)
+
+Email = Annotated[
+    str,
+    AfterValidator(EMAIL_ADAPTER.validate_python),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+# Character-class bits reported by _password_classes
+_HAS_UPPER = 1
+_HAS_LOWER = 2
+_HAS_DIGIT = 4
+_ALL_CLASSES = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT
+
+
+def _password_classes(password: str) -> int:
+    """Scan the password once and return which required character classes it has."""
+    flags = 0
+    for c in password:
+        if "A" <= c <= "Z":
+            flags |= _HAS_UPPER
+        elif "a" <= c <= "z":
+            flags |= _HAS_LOWER
+        elif c.isdecimal():  # same set as the regex \d
+            flags |= _HAS_DIGIT
+        else:
+            continue
+        if flags == _ALL_CLASSES:
+            break
+    return flags
+
+
+def _validate_password_strength(v: str) -> str:
+    """Require at least one uppercase letter, one lowercase letter and one digit."""
+    flags = _password_classes(v)
+    if not flags & _HAS_UPPER:
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not flags & _HAS_LOWER:
+        raise ValueError("Password must contain at least one lowercase letter")
+    if not flags & _HAS_DIGIT:
+        raise ValueError("Password must contain at least one digit")
+    return v
 
 
 class RegisterRequest(BaseModel):
     """User registration request."""
 
-    email: EmailStr
+    email: Email
     full_name: str = Field(min_length=2, max_length=255)
     password: str = Field(min_length=8, max_length=128)
 
@@ -15,19 +69,13 @@ class RegisterRequest(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _validate_password_strength(v)
 
 
 class LoginRequest(BaseModel):
     """User login request."""
 
-    email: EmailStr
+    email: Email
     password: str
 
 
@@ -51,7 +99,7 @@ class RefreshTokenRequest(BaseModel):
 class PasswordResetRequest(BaseModel):
     """Password reset request."""
 
-    email: EmailStr
+    email: Email
 
 
 class PasswordResetConfirm(BaseModel):
@@ -64,13 +112,7 @@ class PasswordResetConfirm(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _validate_password_strength(v)
 
 
 class VerifyEmailRequest(BaseModel):
@@ -89,10 +131,4 @@ class ChangePasswordRequest(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _validate_password_strength(v)
@@ -3,11 +3,26 @@
 from datetime import datetime
 from typing import Any, Generic, TypeVar
 
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
 
+def model_json_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Return a response model as pre-encoded JSON.
+
+    A Response returned from an endpoint is sent as-is, so this skips FastAPI
+    re-validating the model against response_model, converting it to a dict
+    and json.dumps-ing that. Keep response_model on the route for the docs.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 class MessageResponse(BaseModel):
     """Simple message response."""
 
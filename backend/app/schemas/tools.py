@@ -1,9 +1,24 @@
 """Tool-specific request/response schemas."""
 
 from enum import Enum
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import NotRequired, TypedDict
+
+
+class _ToolSchema(BaseModel):
+    """Base for tool request/response schemas."""
+
+    # Immutable, strict about unknown fields, and with the core schema built
+    # on first use instead of at import
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid")
+
+
+# Constrained string types shared across fields, so each pattern is defined
+# (and compiled) once rather than per field
+HexColor = Annotated[str, Field(pattern=r"^#[0-9A-Fa-f]{6}$")]
+ErrorCorrection = Annotated[str, Field(pattern=r"^[LMQH]$")]
 
 
 # ============ QR Code Schemas ============
@@ -33,7 +48,7 @@ class WifiAuthType(str, Enum):
     NOPASS = "nopass"
 
 
-class QRCodeRequest(BaseModel):
+class QRCodeRequest(_ToolSchema):
     """QR code generation request."""
 
     content_type: QRCodeType = QRCodeType.URL
@@ -56,16 +71,16 @@ class QRCodeRequest(BaseModel):
     # Customization
     size: int = Field(default=300, ge=100, le=1000)
     format: QRCodeFormat = QRCodeFormat.PNG
-    foreground_color: str = Field(default="#000000", pattern=r"^#[0-9A-Fa-f]{6}$")
-    background_color: str = Field(default="#FFFFFF", pattern=r"^#[0-9A-Fa-f]{6}$")
-    error_correction: str = Field(default="M", pattern=r"^[LMQH]$")
+    foreground_color: HexColor = "#000000"
+    background_color: HexColor = "#FFFFFF"
+    error_correction: ErrorCorrection = "M"
 
     # Logo overlay (base64 encoded image)
     logo_base64: Optional[str] = None
     logo_size_percent: int = Field(default=20, ge=10, le=30)
 
 
-class QRCodeResponse(BaseModel):
+class QRCodeResponse(_ToolSchema):
     """QR code generation response."""
 
     image_base64: str
@@ -98,7 +113,7 @@ class UnitCategory(str, Enum):
     DATA = "data"
 
 
-class CalculatorRequest(BaseModel):
+class CalculatorRequest(_ToolSchema):
     """Calculator request."""
 
     operation: CalculatorOperation
@@ -122,7 +137,7 @@ class CalculatorRequest(BaseModel):
     value: Optional[float] = None
 
 
-class CalculatorResponse(BaseModel):
+class CalculatorResponse(_ToolSchema):
     """Calculator response."""
 
     operation: CalculatorOperation
@@ -254,7 +269,7 @@ class SocialMediaPlatform(str, Enum):
     PINTEREST_PIN = "pinterest_pin"
 
 
-class ImageRequest(BaseModel):
+class ImageRequest(_ToolSchema):
     """Image processing request."""
 
     operation: ImageOperation
@@ -329,7 +344,7 @@ class ImageRequest(BaseModel):
     passport_country: str = Field(default="US")
 
 
-class ImageResponse(BaseModel):
+class ImageResponse(_ToolSchema):
     """Image processing response."""
 
     operation: ImageOperation
@@ -353,37 +368,24 @@ class PDFOperation(str, Enum):
     TO_POWERPOINT = "to_powerpoint"
 
 
-class PDFSplitRequest(BaseModel):
-    """PDF split request."""
-
-    page_ranges: str = Field(
-        description="Page ranges like '1-5,6-10,11-15' or 'all' for individual pages"
-    )
-
-
-class PDFMergeRequest(BaseModel):
-    """PDF merge request - files uploaded separately."""
-
-    file_order: list[str] = Field(
-        description="List of file IDs in merge order"
-    )
-
+# Result file entries are plain dicts built by the endpoints; TypedDicts give
+# them a schema without constructing a model per file
+class PDFResultFile(TypedDict):
+    """One output file of a PDF operation."""
 
-class PDFCompressRequest(BaseModel):
-    """PDF compression request."""
-
-    compression_level: str = Field(
-        default="medium",
-        pattern=r"^(low|medium|high)$"
-    )
+    filename: str
+    pages: int
+    size: int
+    download_url: str
+    compression_ratio: NotRequired[str]  # compress only
 
 
-class PDFResponse(BaseModel):
+class PDFResponse(_ToolSchema):
     """PDF processing response."""
 
     operation: PDFOperation
     original_pages: int
-    result_files: list[dict[str, Any]]  # [{filename, pages, size, download_url}]
+    result_files: list[PDFResultFile]
     total_size_bytes: int
     watermarked: bool = False
 
@@ -395,40 +397,21 @@ class ExcelOperation(str, Enum):
     TO_CSV = "to_csv"
 
 
-class ExcelRequest(BaseModel):
-    """Excel processing request."""
+class SheetResult(TypedDict):
+    """One CSV file produced from an Excel sheet."""
 
-    operation: ExcelOperation = ExcelOperation.TO_CSV
-    sheets: Optional[list[str]] = Field(
-        default=None,
-        description="Sheet names to convert (None = all sheets)"
-    )
-    preserve_formulas: bool = Field(
-        default=False,
-        description="Include formula columns alongside values"
-    )
-    clean_data: bool = Field(
-        default=True,
-        description="Remove empty rows/columns, trim whitespace"
-    )
+    sheet_name: str
+    rows: int
+    columns: int
+    size: int
+    download_url: str
 
 
-class ExcelResponse(BaseModel):
+class ExcelResponse(_ToolSchema):
     """Excel processing response."""
 
     operation: ExcelOperation
     sheet_count: int
     sheets_processed: list[str]
-    result_files: list[dict[str, Any]]  # [{sheet_name, rows, columns, download_url}]
+    result_files: list[SheetResult]
     total_size_bytes: int
-
-
-# ============ File Upload Response ============
-class FileUploadResponse(BaseModel):
-    """File upload response."""
-
-    file_id: str
-    filename: str
-    size_bytes: int
-    mime_type: str
-    expires_at: str
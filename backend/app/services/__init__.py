@@ -1,9 +1,25 @@
-"""Services module."""
+"""Services module.
 
-from app.services.auth_service import AuthService
-from app.services.email_service import EmailService
-from app.services.usage_service import UsageService
-from app.services.user_service import UserService
+Services are imported on first attribute access (PEP 562), so importing one
+service module does not pull in every other service and its dependencies.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.services.auth_service import AuthService
+    from app.services.email_service import EmailService
+    from app.services.usage_service import UsageService
+    from app.services.user_service import UserService
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    "AuthService": "auth_service",
+    "UserService": "user_service",
+    "EmailService": "email_service",
+    "UsageService": "usage_service",
+}
 
 __all__ = [
     "AuthService",
@@ -11,3 +27,12 @@ __all__ = [
     "EmailService",
     "UsageService",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
@@ -1,7 +1,7 @@
 """Authentication service."""
 
-import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
+from functools import cached_property
 from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,26 +9,36 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from app.core.exceptions import BadRequestError, UnauthorizedError
 from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    averify_password,
     create_access_token,
     create_email_verification_token,
     create_password_reset_token,
     create_refresh_token,
     verify_email_token,
-    verify_password,
     verify_password_reset_token,
     verify_token,
 )
+from app.models.base import utc_now
+from app.models.ids import parse_uuid
 from app.models.user import User
 from app.schemas.auth import TokenResponse
 from app.services.user_service import UserService
 
+# How long a password reset link stays valid
+_PASSWORD_RESET_TTL = timedelta(hours=1)
+
 
 class AuthService:
     """Service for authentication operations."""
 
     def __init__(self, session: AsyncSession):
         self.session = session
-        self.user_service = UserService(session)
+
+    @cached_property
+    def user_service(self) -> UserService:
+        """User service, created on first use (rejected tokens never need it)."""
+        return UserService(self.session)
 
     async def register(
         self,
@@ -59,13 +69,17 @@ class AuthService:
         """Authenticate user and return tokens."""
         user = await self.user_service.get_by_email(email)
 
-        if not user:
+        if not user or not user.hashed_password:
+            # Unknown email or OAuth-only account: spend the same bcrypt time
+            # as a real check so timing doesn't reveal which emails exist
+            await averify_password(password, DUMMY_PASSWORD_HASH)
             raise UnauthorizedError(message="Invalid email or password")
 
-
-        if not verify_password(password, user.hashed_password):
+        if not await averify_password(password, user.hashed_password):
             raise UnauthorizedError(message="Invalid email or password")
 
+        # Checked after the password so a deactivated account is only
+        # disclosed to someone who knows its password
         if not user.is_active:
             raise UnauthorizedError(message="Account is deactivated")
 
@@ -83,7 +97,7 @@ class AuthService:
         if not user_id:
             raise UnauthorizedError(message="Invalid refresh token")
 
-        user = await self.user_service.get_by_id(uuid.UUID(user_id))
+        user = await self.user_service.get_by_id(parse_uuid(user_id))
 
         if not user or not user.is_active:
             raise UnauthorizedError(message="User not found or inactive")
@@ -116,7 +130,7 @@ class AuthService:
             return None
 
         token = create_password_reset_token(email)
-        expires = datetime.now(timezone.utc) + timedelta(hours=1)
+        expires = utc_now() + _PASSWORD_RESET_TTL
         await self.user_service.set_password_reset_token(user, token, expires)
 
         return token
@@ -132,9 +146,7 @@ class AuthService:
         if not user.password_reset_token or user.password_reset_token != token:
             raise BadRequestError(message="Invalid or expired reset token")
 
-        if user.password_reset_expires and user.password_reset_expires < datetime.now(
-            timezone.utc
-        ):
+        if user.password_reset_expires and user.password_reset_expires < utc_now():
             raise BadRequestError(message="Reset token has expired")
 
         return await self.user_service.update_password(user, new_password)
@@ -151,7 +163,7 @@ class AuthService:
                 message="Cannot change password for OAuth accounts"
             )
 
-        if not verify_password(current_password, user.hashed_password):
+        if not await averify_password(current_password, user.hashed_password):
             raise BadRequestError(message="Current password is incorrect")
 
         return await self.user_service.update_password(user, new_password)
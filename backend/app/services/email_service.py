@@ -1,10 +1,15 @@
 """Email service using ZeptoMail."""
 
+import logging
+from html import escape
 from typing import Optional
 
 import httpx
 
 from app.config import settings
+from app.core.jsonutil import dumps_bytes
+
+logger = logging.getLogger(__name__)
 
 
 class EmailService:
@@ -16,6 +21,30 @@ class EmailService:
         self.api_key = settings.zeptomail_api_key
         self.from_email = settings.zeptomail_from_email
         self.from_name = settings.zeptomail_from_name
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps the ZeptoMail connection alive between sends
+        instead of paying a TCP and TLS handshake per email.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={
+                    "Authorization": f"Zoho-enczapikey {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def send_email(
         self,
@@ -31,7 +60,7 @@ class EmailService:
         """
         if not self.api_key:
             # Log warning in development
-            print(f"[EMAIL] Would send to {to_email}: {subject}")
+            logger.warning("[EMAIL] Would send to %s: %s", to_email, subject)
             return True
 
         payload = {
@@ -45,19 +74,13 @@ class EmailService:
             payload["textbody"] = text_body
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.ZEPTOMAIL_API_URL,
-                    json=payload,
-                    headers={
-                        "Authorization": f"Zoho-enczapikey {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    timeout=30.0,
-                )
-                return response.status_code == 200
+            # The client already sends Content-Type: application/json
+            response = await self._get_client().post(
+                self.ZEPTOMAIL_API_URL, content=dumps_bytes(payload)
+            )
+            return response.status_code == 200
         except Exception as e:
-            print(f"[EMAIL ERROR] Failed to send email: {e}")
+            logger.error("[EMAIL ERROR] Failed to send email: %s", e)
             return False
 
     async def send_verification_email(
@@ -68,6 +91,9 @@ class EmailService:
     ) -> bool:
         """Send email verification email."""
         subject = "Verify your ToolHub account"
+        # User-supplied values are escaped before going into the HTML body
+        html_name = escape(to_name)
+        html_url = escape(verification_url)
         html_body = f"""
         <!DOCTYPE html>
         <html>
@@ -83,13 +109,13 @@ class EmailService:
         <body>
             <div class="container">
                 <h1>Welcome to ToolHub!</h1>
-                <p>Hi {to_name},</p>
+                <p>Hi {html_name},</p>
                 <p>Thanks for signing up! Please verify your email address by clicking the button below:</p>
                 <p style="margin: 30px 0;">
-                    <a href="{verification_url}" class="button">Verify Email</a>
+                    <a href="{html_url}" class="button">Verify Email</a>
                 </p>
                 <p>Or copy and paste this link into your browser:</p>
-                <p style="word-break: break-all; color: #2563eb;">{verification_url}</p>
+                <p style="word-break: break-all; color: #2563eb;">{html_url}</p>
                 <p>This link will expire in 24 hours.</p>
                 <div class="footer">
                     <p>If you didn't create an account, you can safely ignore this email.</p>
@@ -125,6 +151,8 @@ class EmailService:
     ) -> bool:
         """Send password reset email."""
         subject = "Reset your ToolHub password"
+        html_name = escape(to_name)
+        html_url = escape(reset_url)
         html_body = f"""
         <!DOCTYPE html>
         <html>
@@ -141,13 +169,13 @@ class EmailService:
         <body>
             <div class="container">
                 <h1>Password Reset Request</h1>
-                <p>Hi {to_name},</p>
+                <p>Hi {html_name},</p>
                 <p>We received a request to reset your password. Click the button below to set a new password:</p>
                 <p style="margin: 30px 0;">
-                    <a href="{reset_url}" class="button">Reset Password</a>
+                    <a href="{html_url}" class="button">Reset Password</a>
                 </p>
                 <p>Or copy and paste this link into your browser:</p>
-                <p style="word-break: break-all; color: #2563eb;">{reset_url}</p>
+                <p style="word-break: break-all; color: #2563eb;">{html_url}</p>
                 <div class="warning">
                     <strong>⚠️ This link will expire in 1 hour.</strong>
                 </div>
@@ -184,6 +212,7 @@ class EmailService:
     ) -> bool:
         """Send welcome email after verification."""
         subject = "Welcome to ToolHub! 🎉"
+        html_name = escape(to_name)
         html_body = f"""
         <!DOCTYPE html>
         <html>
@@ -201,7 +230,7 @@ class EmailService:
         <body>
             <div class="container">
                 <h1>Welcome to ToolHub! 🎉</h1>
-                <p>Hi {to_name},</p>
+                <p>Hi {html_name},</p>
                 <p>Your account is now verified and ready to use. Here's what you can do with ToolHub:</p>
 
                 <div class="feature">
@@ -256,6 +285,8 @@ class EmailService:
         """Send thank you email after donation."""
         display_name = to_name if to_name else "Supporter"
         subject = "Thank you for supporting Tulz! 💖"
+        html_name = escape(display_name)
+        html_currency = escape(currency)
         html_body = f"""
         <!DOCTYPE html>
         <html>
@@ -274,10 +305,10 @@ class EmailService:
             <div class="container">
                 <div class="heart">💖</div>
                 <h1 style="text-align: center;">Thank You!</h1>
-                <p>Hi {display_name},</p>
+                <p>Hi {html_name},</p>
                 <p>We're incredibly grateful for your generous donation to Tulz!</p>
 
-                <div class="amount">${amount:.2f} {currency}</div>
+                <div class="amount">${amount:.2f} {html_currency}</div>
 
                 <div class="message">
                     <p><strong>Your support means the world to us.</strong></p>
@@ -1,16 +1,72 @@
 """GeoIP service for country detection from IP addresses."""
 
 import asyncio
+import ipaddress
+from collections import OrderedDict
 from typing import Optional, Tuple
 import httpx
-from functools import lru_cache
+
+# Maximum number of IP lookups kept in the in-memory LRU cache
+GEOIP_CACHE_SIZE = 10000
+
+# geojs.io country lookup (free, unlimited requests)
+GEOJS_COUNTRY_URL = "https://get.geojs.io/v1/ip/country/{}.json"
+
+GEOIP_TIMEOUT = 5.0
 
 
 class GeoIPService:
     """Service to get country information from IP addresses."""
 
-    # Cache for IP lookups (simple in-memory cache)
-    _cache: dict[str, Tuple[Optional[str], Optional[str]]] = {}
+    # LRU cache of IP lookups; evicts one entry at a time once full
+    _cache: OrderedDict[str, Tuple[Optional[str], Optional[str]]] = OrderedDict()
+
+    # Lookups in progress keyed by IP, so concurrent callers for the same
+    # address share one upstream request
+    _inflight: dict[str, "asyncio.Task[Tuple[Optional[str], Optional[str]]]"] = {}
+
+    # Kept-alive client for get_country_sync, created on first use
+    _sync_client: Optional[httpx.Client] = None
+
+    @classmethod
+    def _get_cached(cls, ip_address: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """Return a cached lookup and mark it as recently used."""
+        cached = cls._cache.get(ip_address)
+        if cached is not None:
+            cls._cache.move_to_end(ip_address)
+        return cached
+
+    @staticmethod
+    def _is_public(ip_address: str) -> bool:
+        """Whether an address is worth looking up.
+
+        Rejects private, loopback, link-local, carrier-grade NAT and reserved
+        addresses, and anything that is not an IP at all ("unknown",
+        "localhost").
+        """
+        try:
+            return ipaddress.ip_address(ip_address).is_global
+        except ValueError:
+            return False
+
+    @classmethod
+    def _handle_response(
+        cls, ip_address: str, response: httpx.Response
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Extract and cache the country from a geojs.io response."""
+        if response.status_code == 200:
+            data = response.json()
+            country_code = data.get("country")
+            country_name = data.get("name")
+
+            if country_code and country_name:
+                # Cache the result, evicting the least recently used
+                cls._cache[ip_address] = (country_code, country_name)
+                if len(cls._cache) > GEOIP_CACHE_SIZE:
+                    cls._cache.popitem(last=False)
+                return country_code, country_name
+
+        return None, None
 
     @classmethod
     async def get_country(cls, ip_address: str) -> Tuple[Optional[str], Optional[str]]:
@@ -20,58 +76,53 @@ class GeoIPService:
         Returns:
             Tuple of (country_code, country_name) or (None, None) if lookup fails
         """
-        # Skip local/private IPs
-        if ip_address in ("127.0.0.1", "localhost", "unknown", "::1"):
-            return None, None
+        # Check cache; only public addresses are ever cached
+        cached = cls._get_cached(ip_address)
+        if cached is not None:
+            return cached
 
-        if ip_address.startswith(("10.", "172.16.", "172.17.", "172.18.", "172.19.",
-                                   "172.20.", "172.21.", "172.22.", "172.23.",
-                                   "172.24.", "172.25.", "172.26.", "172.27.",
-                                   "172.28.", "172.29.", "172.30.", "172.31.",
-                                   "192.168.")):
+        if not cls._is_public(ip_address):
             return None, None
 
-        # Check cache
-        if ip_address in cls._cache:
-            return cls._cache[ip_address]
+        task = cls._inflight.get(ip_address)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(cls._fetch_country(ip_address))
+            cls._inflight[ip_address] = task
+            task.add_done_callback(lambda _: cls._inflight.pop(ip_address, None))
+        # Shielded so one caller being cancelled does not cancel the lookup
+        # for everyone else waiting on it
+        return await asyncio.shield(task)
 
+    @classmethod
+    async def _fetch_country(cls, ip_address: str) -> Tuple[Optional[str], Optional[str]]:
+        """Look up an address on geojs.io."""
         try:
-            # Use geojs.io (free, unlimited requests)
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"https://get.geojs.io/v1/ip/country/{ip_address}.json"
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    country_code = data.get("country")
-                    country_name = data.get("name")
-                    
-                    if country_code and country_name:
-                        # Cache the result
-                        cls._cache[ip_address] = (country_code, country_name)
-                        # Limit cache size
-                        if len(cls._cache) > 10000:
-                            # Remove oldest entries (simple approach)
-                            keys = list(cls._cache.keys())[:5000]
-                            for key in keys:
-                                del cls._cache[key]
-                        return country_code, country_name
-
+            async with httpx.AsyncClient(timeout=GEOIP_TIMEOUT) as client:
+                response = await client.get(GEOJS_COUNTRY_URL.format(ip_address))
+                return cls._handle_response(ip_address, response)
         except Exception:
             # Don't fail the request if GeoIP lookup fails
-            pass
-
-        return None, None
+            return None, None
 
     @classmethod
     def get_country_sync(cls, ip_address: str) -> Tuple[Optional[str], Optional[str]]:
-        """Synchronous wrapper for get_country."""
+        """
+        Blocking variant of get_country for code without an event loop.
+
+        Shares the cache with get_country. Async code should await
+        get_country instead of calling this.
+        """
+        cached = cls._get_cached(ip_address)
+        if cached is not None:
+            return cached
+
+        if not cls._is_public(ip_address):
+            return None, None
+
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # We're in an async context, return None and let caller handle
-                return None, None
-            return loop.run_until_complete(cls.get_country(ip_address))
-        except RuntimeError:
+            if cls._sync_client is None:
+                cls._sync_client = httpx.Client(timeout=GEOIP_TIMEOUT)
+            response = cls._sync_client.get(GEOJS_COUNTRY_URL.format(ip_address))
+            return cls._handle_response(ip_address, response)
+        except Exception:
             return None, None
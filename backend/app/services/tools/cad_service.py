@@ -3,9 +3,6 @@ import io
 import fitz
 import ezdxf
 from ezdxf import recover
-from ezdxf.addons.drawing import RenderContext, Frontend
-from ezdxf.addons.drawing.matplotlib import MatplotlibBackend
-import matplotlib.pyplot as plt
 from typing import Tuple, List
 import tempfile
 import subprocess
@@ -68,6 +65,11 @@ class CADService:
             if auditor.has_errors:
                 pass
 
+            # Imported here: matplotlib is slow to import and only needed for rendering
+            import matplotlib.pyplot as plt
+            from ezdxf.addons.drawing import Frontend, RenderContext
+            from ezdxf.addons.drawing.matplotlib import MatplotlibBackend
+
             fig = plt.figure()
             ax = fig.add_axes([0, 0, 1, 1])
             ctx = RenderContext(doc)
@@ -1,7 +1,10 @@
 """Calculator service for scientific, financial, and unit calculations."""
 
+import ast
 import math
 import re
+from functools import lru_cache
+from types import CodeType
 from typing import Any
 
 from app.core.exceptions import BadRequestError
@@ -12,6 +15,48 @@ from app.schemas.tools import (
     UnitCategory,
 )
 
+# Characters an expression may contain before it is parsed
+_EXPRESSION_CHARS_RE = re.compile(r"^[\d\s\+\-\*\/\.\(\)\,\^a-zA-Z]+$")
+
+# AST nodes an expression may contain: arithmetic on numbers, names and
+# calls of SAFE_FUNCTIONS. Anything else (attribute access, subscripts,
+# comprehensions, lambdas, ...) is rejected before the code is compiled.
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+
+@lru_cache(maxsize=1024)
+def _compile_expression(expr: str) -> CodeType:
+    """Parse, whitelist-check and compile an expression, caching the code.
+
+    Live-preview calculators resend the same expressions, so repeats skip
+    parsing and compiling. Failures raise and are not cached.
+    """
+    tree = ast.parse(expr, "<string>", mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"{type(node).__name__} is not allowed")
+        if isinstance(node, ast.Call) and not isinstance(node.func, ast.Name):
+            raise ValueError("only named functions can be called")
+        if isinstance(node, ast.Name) and node.id not in CalculatorService.SAFE_FUNCTIONS:
+            raise NameError(f"name '{node.id}' is not defined")
+    return compile(tree, "<string>", "eval")
+
 
 class CalculatorService:
     """Service for calculator operations."""
@@ -121,6 +166,9 @@ class CalculatorService:
         "deg": math.degrees,
     }
 
+    # Evaluation globals, built once; expressions cannot assign to them
+    _EVAL_NAMESPACE = {"__builtins__": {}, **SAFE_FUNCTIONS}
+
     def calculate(self, data: CalculatorRequest) -> CalculatorResponse:
         """Perform calculation based on operation type."""
         if data.operation == CalculatorOperation.EVALUATE:
@@ -159,19 +207,14 @@ class CalculatorService:
         expr = expression.strip()
 
         # Validate expression - only allow safe characters
-        if not re.match(r"^[\d\s\+\-\*\/\.\(\)\,\^a-zA-Z]+$", expr):
+        if not _EXPRESSION_CHARS_RE.match(expr):
             raise BadRequestError(message="Invalid characters in expression")
 
         # Replace ^ with ** for exponentiation
         expr = expr.replace("^", "**")
 
         try:
-            # Create safe namespace
-            namespace = {"__builtins__": {}}
-            namespace.update(self.SAFE_FUNCTIONS)
-
-            # Evaluate
-            result = eval(expr, namespace)
+            result = eval(_compile_expression(expr), self._EVAL_NAMESPACE)
 
             # Format result
             if isinstance(result, float):
@@ -209,12 +252,8 @@ class CalculatorService:
             emi = principal / tenure_months
         else:
             # EMI formula: P * r * (1+r)^n / ((1+r)^n - 1)
-            emi = (
-                principal
-                * monthly_rate
-                * math.pow(1 + monthly_rate, tenure_months)
-                / (math.pow(1 + monthly_rate, tenure_months) - 1)
-            )
+            growth = (1 + monthly_rate) ** tenure_months
+            emi = principal * monthly_rate * growth / (growth - 1)
 
         total_payment = emi * tenure_months
         total_interest = total_payment - principal
@@ -34,6 +34,7 @@ def _get_rembg_session():
             from rembg import new_session
             # Use u2netp - much faster than default u2net (5x faster)
             # It's slightly less accurate but good enough for most use cases
+            # (keep in sync with app.workers.model_preloader.REMBG_MODEL_NAME)
             _rembg_session = new_session("u2netp")
             logger.info("Loaded rembg session with u2netp model")
         except Exception as e:
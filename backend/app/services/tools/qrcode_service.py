@@ -2,6 +2,7 @@
 
 import base64
 import io
+from functools import lru_cache
 from typing import Optional
 
 import qrcode
@@ -12,6 +13,13 @@ from PIL import Image, ImageDraw, ImageFont
 from app.schemas.tools import QRCodeFormat, QRCodeRequest, QRCodeType
 
 
+@lru_cache(maxsize=256)
+def _hex_to_rgb(color: str) -> tuple[int, int, int]:
+    """Convert a validated "#RRGGBB" color to an RGB tuple."""
+    value = int(color[1:], 16)
+    return (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+
+
 class QRCodeService:
     """Service for QR code generation."""
 
@@ -93,9 +101,10 @@ class QRCodeService:
 
     def _generate_png(self, qr: qrcode.QRCode, data: QRCodeRequest) -> bytes:
         """Generate PNG image."""
-        # Parse colors
-        fg_color = data.foreground_color
-        bg_color = data.background_color
+        # Parse colors once; qrcode hands fill_color to ImageDraw for every
+        # dark module, and a tuple skips PIL's color-string lookup each time
+        fg_color = _hex_to_rgb(data.foreground_color)
+        bg_color = _hex_to_rgb(data.background_color)
 
         # Create image
         img = qr.make_image(
@@ -5,21 +5,54 @@ Implements:
 - Pro tier: 500 uses per day (fair use soft limit)
 - Rate limiting per tier
 - Analytics tracking for all usage
+
+Usage rows are not written through the request session; finished records are
+handed to the batching usage writer (app.workers.usage_writer).
 """
 
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.core.exceptions import UsageLimitError
 from app.core.rate_limiter import PRO_DAILY_OPERATIONS_LIMIT, PRO_DAILY_DATA_LIMIT_MB
-from app.models.history import ToolType, UsageHistory
+from app.models.history import ToolType, UsageHistory, cap_metadata
 from app.models.user import User
 from app.services.geoip_service import GeoIPService
+from app.workers.usage_writer import usage_writer
+
+
+# Columns returned for history listings. Selecting these directly yields plain
+# Row tuples, so serializing them skips ORM object construction and
+# attribute instrumentation.
+_HISTORY_SUMMARY_COLUMNS = (
+    UsageHistory.id,
+    UsageHistory.tool,
+    UsageHistory.operation,
+    UsageHistory.processing_time_ms,
+    UsageHistory.tier_at_use,
+    UsageHistory.success,
+    UsageHistory.created_at,
+)
+
+# Column names copied from a UsageHistory into the row handed to the writer
+_USAGE_COLUMNS = tuple(c.name for c in UsageHistory.__table__.columns)
+
+
+def _enqueue_history(history: UsageHistory) -> None:
+    """Queue a finished usage record for the next bulk insert.
+
+    Metadata is capped here so an oversized row cannot fail the
+    usage_metadata_size check and take the rest of its batch down with it.
+    """
+    row = {name: getattr(history, name) for name in _USAGE_COLUMNS}
+    row["input_metadata"] = cap_metadata(row["input_metadata"])
+    row["output_metadata"] = cap_metadata(row["output_metadata"])
+    usage_writer.enqueue(row)
 
 
 # In-memory rate limiting (resets on server restart)
@@ -32,7 +65,9 @@ _pro_usage_cache: dict[str, dict] = {}
 class UsageService:
     """Service for tracking and enforcing usage limits."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: Optional[AsyncSession] = None):
+        # Only the limit checks and history queries use the session;
+        # analytics-only recording can be done without one
         self.session = session
 
     async def check_and_record_usage(
@@ -47,6 +82,8 @@ class UsageService:
         """
         Check if usage is allowed and record it.
         Returns (usage_history, tier) or raises UsageLimitError.
+
+        The returned record is only written once complete_usage() is called.
         """
         # Everyone gets unlimited access now
         tier = "pro"
@@ -67,14 +104,12 @@ class UsageService:
                 input_metadata=input_metadata,
                 tier_at_use=tier,
             )
-            self.session.add(history)
-            await self.session.flush()
             return history, tier
         except Exception as e:
             # Analytics failure should NOT crash the tool in pro/unlimited mode
             print(f"[USAGE-SERVICE ERROR] Failed to record usage: {e}")
             # Return a "dummy" history object that won't crash when passed to complete_usage
-            dummy_history = UsageHistory(tool=tool, operation=operation)
+            dummy_history = UsageHistory(id=None, tool=tool, operation=operation)
             return dummy_history, tier
 
     async def complete_usage(
@@ -85,6 +120,7 @@ class UsageService:
         success: bool = True,
         error_message: Optional[str] = None,
     ) -> UsageHistory:
+        """Fill in the outcome of a usage record and queue it for writing."""
         try:
             # If id is None, it's our dummy object from a failed check_and_record_usage
             if history.id is None:
@@ -94,7 +130,7 @@ class UsageService:
             history.output_metadata = output_metadata
             history.success = success
             history.error_message = error_message
-            await self.session.flush()
+            _enqueue_history(history)
         except Exception as e:
             print(f"[USAGE-SERVICE ERROR] Failed to complete usage: {e}")
             
@@ -155,12 +191,12 @@ class UsageService:
 
         # Recent history
         recent_result = await self.session.execute(
-            select(UsageHistory)
+            select(*_HISTORY_SUMMARY_COLUMNS)
             .where(UsageHistory.user_id == user.id)
             .order_by(UsageHistory.created_at.desc())
             .limit(10)
         )
-        recent = recent_result.scalars().all()
+        recent = recent_result.all()
 
         return {
             "total_uses": total_uses,
@@ -172,15 +208,15 @@ class UsageService:
 
     async def get_history(
         self, user: User, limit: int = 50
-    ) -> list[UsageHistory]:
-        """Get usage history for a user."""
+    ) -> list[Row]:
+        """Get usage history rows (summary columns only) for a user."""
         result = await self.session.execute(
-            select(UsageHistory)
+            select(*_HISTORY_SUMMARY_COLUMNS)
             .where(UsageHistory.user_id == user.id)
             .order_by(UsageHistory.created_at.desc())
             .limit(limit)
         )
-        return result.scalars().all()
+        return result.all()
 
 
     async def _can_use(
@@ -290,8 +326,7 @@ class UsageService:
                 success=success,
                 error_message=error_message,
             )
-            self.session.add(history)
-            await self.session.flush()
+            _enqueue_history(history)
             return history
         except Exception as e:
             print(f"[USAGE-SERVICE ERROR] Failed to record analytics: {e}")
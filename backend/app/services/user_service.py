@@ -8,7 +8,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import BadRequestError, NotFoundError
-from app.core.security import get_password_hash
+from app.core.security import aget_password_hash
+from app.models.base import utc_now
 from app.models.user import User
 
 
@@ -65,7 +66,7 @@ class UserService:
         user = User(
             email=email.lower(),
             full_name=full_name,
-            hashed_password=get_password_hash(password) if password else None,
+            hashed_password=await aget_password_hash(password) if password else None,
             oauth_provider=oauth_provider,
             oauth_id=oauth_id,
             avatar_url=avatar_url,
@@ -87,32 +88,32 @@ class UserService:
             user.full_name = full_name
         if avatar_url is not None:
             user.avatar_url = avatar_url
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utc_now()
         await self.session.flush()
         return user
 
     async def update_password(self, user: User, new_password: str) -> User:
         """Update user password."""
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await aget_password_hash(new_password)
         user.password_reset_token = None
         user.password_reset_expires = None
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utc_now()
         await self.session.flush()
         return user
 
     async def verify_email(self, user: User) -> User:
         """Mark user email as verified."""
         user.is_verified = True
-        user.verified_at = datetime.utcnow()
+        user.verified_at = utc_now()
         user.verification_token = None
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utc_now()
         await self.session.flush()
         return user
 
     async def set_verification_token(self, user: User, token: str) -> User:
         """Set email verification token."""
         user.verification_token = token
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utc_now()
         await self.session.flush()
         return user
 
@@ -122,7 +123,7 @@ class UserService:
         """Set password reset token."""
         user.password_reset_token = token
         user.password_reset_expires = expires
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utc_now()
         await self.session.flush()
         return user
 
@@ -130,6 +131,6 @@ class UserService:
     async def deactivate(self, user: User) -> User:
         """Deactivate user account."""
         user.is_active = False
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utc_now()
         await self.session.flush()
         return user
@@ -0,0 +1,158 @@
+"""Write-behind batching for analytics rows.
+
+Rows are queued in memory by request handlers and inserted in bulk by a single
+background consumer per writer, so requests never wait on an INSERT and COMMIT
+round trip of their own.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.sql import Executable
+
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of rows held in memory before new ones are dropped
+QUEUE_MAX_SIZE = 10_000
+
+# Queued by stop() to tell the consumer to finish its batch and exit
+_STOP = object()
+
+
+class BatchWriter:
+    """Bounded queue drained into executemany inserts by one background task.
+
+    A batch is written once it holds `batch_size` rows or its oldest row has
+    waited `flush_interval` seconds. Rows still buffered on shutdown are
+    flushed by stop().
+    """
+
+    def __init__(
+        self,
+        name: str,
+        statement: Executable,
+        batch_size: int,
+        flush_interval: float,
+        queue_max_size: int = QUEUE_MAX_SIZE,
+    ) -> None:
+        self.name = name
+        self.statement = statement
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.q: asyncio.Queue = asyncio.Queue(maxsize=queue_max_size)
+        self._task: Optional[asyncio.Task] = None
+        self._dropped = 0
+
+    def enqueue(self, row: dict) -> None:
+        """Buffer a row for the next bulk insert.
+
+        Analytics are best-effort: when the buffer is full the row is dropped
+        instead of making the request wait for the writer to catch up.
+        """
+        try:
+            self.q.put_nowait(row)
+        except asyncio.QueueFull:
+            self._dropped += 1
+            if self._dropped % 1000 == 1:
+                logger.warning(
+                    "[%s-WRITER] Queue full, dropped %d rows so far",
+                    self.name.upper(), self._dropped,
+                )
+
+    async def _write_batch(self, batch: list[dict]) -> None:
+        """Insert a batch of rows with a single executemany and commit.
+
+        Goes straight to a Core connection; an ORM session adds nothing here.
+        """
+        if not batch:
+            return
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(self.statement, batch)
+        except (IntegrityError, DataError):
+            # One bad row rolls back the whole batch; retry row by row so
+            # only that row is lost
+            await self._write_rows(batch)
+        except Exception as e:
+            logger.error(
+                "[%s-WRITER ERROR] Failed to write %d rows: %s",
+                self.name.upper(), len(batch), e,
+            )
+
+    async def _write_rows(self, batch: list[dict]) -> None:
+        """Insert rows one at a time, each in its own transaction."""
+        failed = 0
+        for row in batch:
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(self.statement, row)
+            except Exception as e:
+                failed += 1
+                last_error = e
+        if failed:
+            logger.error(
+                "[%s-WRITER ERROR] Failed to write %d of %d rows: %s",
+                self.name.upper(), failed, len(batch), last_error,
+            )
+
+    async def run(self) -> None:
+        """Collect rows into batches by size or deadline and write them.
+
+        Returns after writing its current batch once stop() queues _STOP.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self.q.get()
+            if row is _STOP:
+                return
+            batch = [row]
+            stopping = False
+            try:
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        row = await asyncio.wait_for(self.q.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if row is _STOP:
+                        stopping = True
+                        break
+                    batch.append(row)
+            except asyncio.CancelledError:
+                await self._write_batch(batch)
+                raise
+            await self._write_batch(batch)
+            if stopping:
+                return
+
+    def start(self) -> None:
+        """Start the background consumer on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the consumer and flush any rows still buffered.
+
+        The consumer is signalled rather than cancelled, so a batch that is
+        being written when shutdown starts is committed instead of rolled back.
+        """
+        if self._task is not None:
+            if not self._task.done():
+                await self.q.put(_STOP)
+                await self._task
+            self._task = None
+
+        while not self.q.empty():
+            batch = []
+            while len(batch) < self.batch_size and not self.q.empty():
+                row = self.q.get_nowait()
+                if row is not _STOP:
+                    batch.append(row)
+            await self._write_batch(batch)
@@ -0,0 +1,30 @@
+"""Fetch ML model files once in the Gunicorn master, before workers fork.
+
+Each worker still builds its own ONNX session (onnxruntime sessions own native
+thread pools and cannot be shared across a fork), but the model file is
+downloaded and checksummed a single time instead of every worker racing to
+fetch it into ~/.u2net on a cold start.
+"""
+
+# Must match the model used by image_service._get_rembg_session
+REMBG_MODEL_NAME = "u2netp"
+
+
+def download_rembg_model() -> None:
+    """Download the rembg model file if it is not already cached on disk."""
+    try:
+        from rembg.sessions import sessions_class
+    except ImportError:
+        print("[MODEL-PRELOAD] rembg not installed, skipping")
+        return
+
+    for session_class in sessions_class:
+        if session_class.name() == REMBG_MODEL_NAME:
+            try:
+                path = session_class.download_models()
+                print(f"[MODEL-PRELOAD] {REMBG_MODEL_NAME} model ready at {path}")
+            except Exception as e:
+                print(f"[MODEL-PRELOAD] Failed to fetch {REMBG_MODEL_NAME} model: {e}")
+            return
+
+    print(f"[MODEL-PRELOAD] Unknown rembg model {REMBG_MODEL_NAME}, skipping")
@@ -0,0 +1,43 @@
+"""Cross-worker guarded ML model preloading."""
+
+import fcntl
+import os
+
+from app.config import settings
+
+_LOCK_PATH = os.path.join(settings.temp_file_dir, ".rembg_preload.lock")
+
+
+def preload_ml_models():
+    """Pre-load ML models for faster first request."""
+    try:
+        from app.services.tools.image_service import _get_rembg_session
+        _get_rembg_session()
+        print("Pre-loaded rembg model for background removal")
+    except Exception as e:
+        print(f"Warning: Failed to pre-load rembg model: {e}")
+
+
+def preload_once():
+    """Preload models in whichever worker takes the lock first.
+
+    Workers boot together; the rest skip the preload instead of initialising
+    the same ONNX session in parallel, and load it on first use.
+    """
+    try:
+        fd = os.open(_LOCK_PATH, os.O_CREAT | os.O_RDWR)
+    except OSError as e:
+        print(f"Warning: Cannot open preload lock {_LOCK_PATH}: {e}")
+        return
+
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return  # Another worker is already preloading
+        try:
+            preload_ml_models()
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
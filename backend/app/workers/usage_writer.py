@@ -0,0 +1,23 @@
+"""Write-behind buffer for tool usage analytics.
+
+Finished usage records are queued in memory by UsageService and inserted in
+bulk by a batch writer, so tool requests no longer pay for an INSERT and
+COMMIT round trip of their own.
+"""
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.history import UsageHistory
+from app.workers.batch_writer import BatchWriter
+
+# Flush when this many rows are buffered...
+BATCH_SIZE = 100
+
+# ...or when the oldest buffered row has waited this long (seconds)
+FLUSH_INTERVAL = 0.1
+
+# Ids are generated client-side, so a retried batch must not fail on rows
+# that already made it in
+_INSERT = pg_insert(UsageHistory.__table__).on_conflict_do_nothing()
+
+usage_writer = BatchWriter("usage", _INSERT, BATCH_SIZE, FLUSH_INTERVAL)
@@ -0,0 +1,16 @@
+"""Write-behind buffer for page visit analytics.
+
+Visits are queued in memory by the tracking endpoint and inserted in bulk by a
+batch writer, so a page view never waits on a database round trip.
+"""
+
+from app.models.page_visit import PageVisit
+from app.workers.batch_writer import BatchWriter
+
+# Flush when this many visits are buffered...
+BATCH_SIZE = 500
+
+# ...or when the oldest buffered visit has waited this long (seconds)
+FLUSH_INTERVAL = 2.0
+
+visit_writer = BatchWriter("visit", PageVisit.__table__.insert(), BATCH_SIZE, FLUSH_INTERVAL)
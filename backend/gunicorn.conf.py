@@ -49,7 +49,11 @@ preload_app = True
 # Hooks
 def on_starting(server):
     """Called just before the master process is initialized."""
-    pass
+    from app.config import settings
+
+    if settings.preload_shared_model:
+        from app.workers.model_preloader import download_rembg_model
+        download_rembg_model()
 
 def on_reload(server):
     """Called to recycle workers during a reload via SIGHUP."""
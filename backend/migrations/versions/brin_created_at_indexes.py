@@ -0,0 +1,46 @@
+"""Replace created_at composite B-tree indexes with BRIN
+
+Revision ID: brin_created_at_indexes
+Revises: d24021352fb0
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'brin_created_at_indexes'
+down_revision: Union[str, None] = 'd24021352fb0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index append-only analytics tables by block range on created_at."""
+    op.drop_index('ix_usage_history_tier_tool_created', table_name='usage_history', if_exists=True)
+    op.drop_index('ix_usage_history_country_created', table_name='usage_history', if_exists=True)
+    op.create_index(
+        'ix_usage_history_created_brin', 'usage_history', ['created_at'],
+        postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+        if_not_exists=True,
+    )
+
+    op.drop_index('ix_page_visits_path_created', table_name='page_visits', if_exists=True)
+    op.drop_index('ix_page_visits_created', table_name='page_visits', if_exists=True)
+    op.create_index(
+        'ix_page_visits_created_brin', 'page_visits', ['created_at'],
+        postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Restore the composite B-tree indexes."""
+    op.drop_index('ix_page_visits_created_brin', table_name='page_visits', if_exists=True)
+    op.create_index('ix_page_visits_created', 'page_visits', ['created_at'])
+    op.create_index('ix_page_visits_path_created', 'page_visits', ['path', 'created_at'])
+
+    op.drop_index('ix_usage_history_created_brin', table_name='usage_history', if_exists=True)
+    op.create_index('ix_usage_history_country_created', 'usage_history', ['country_code', 'created_at'])
+    op.create_index('ix_usage_history_tier_tool_created', 'usage_history', ['tier_at_use', 'tool', 'created_at'])
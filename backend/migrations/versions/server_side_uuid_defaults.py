@@ -0,0 +1,33 @@
+"""Add gen_random_uuid() defaults to primary keys
+
+Revision ID: server_side_uuid_defaults
+Revises: usage_metadata_lz4_and_cap
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'server_side_uuid_defaults'
+down_revision: Union[str, None] = 'usage_metadata_lz4_and_cap'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ('users', 'usage_history', 'page_visits', 'donations', 'feedback')
+
+
+def upgrade() -> None:
+    """Let rows inserted outside the application get an id from the database."""
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it before that
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    """Drop the id defaults."""
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,35 @@
+"""Compress usage metadata with lz4 and cap its size
+
+Revision ID: usage_metadata_lz4_and_cap
+Revises: brin_created_at_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'usage_metadata_lz4_and_cap'
+down_revision: Union[str, None] = 'brin_created_at_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Use lz4 TOAST compression (PostgreSQL 14+) and bound metadata size."""
+    op.execute("ALTER TABLE usage_history ALTER COLUMN input_metadata SET COMPRESSION lz4")
+    op.execute("ALTER TABLE usage_history ALTER COLUMN output_metadata SET COMPRESSION lz4")
+    # NOT VALID: enforce on new rows without scanning or rejecting existing ones
+    op.execute(
+        "ALTER TABLE usage_history ADD CONSTRAINT usage_metadata_size "
+        "CHECK (octet_length(input_metadata::text) < 4096 "
+        "AND octet_length(output_metadata::text) < 4096) NOT VALID"
+    )
+
+
+def downgrade() -> None:
+    """Drop the size cap and return to the default compression."""
+    op.drop_constraint('usage_metadata_size', 'usage_history', type_='check')
+    op.execute("ALTER TABLE usage_history ALTER COLUMN output_metadata SET COMPRESSION default")
+    op.execute("ALTER TABLE usage_history ALTER COLUMN input_metadata SET COMPRESSION default")
@@ -0,0 +1,56 @@
+import asyncio
+import unittest
+from contextlib import asynccontextmanager
+from unittest import mock
+
+from app.workers import batch_writer as batch_writer_module
+from app.workers.batch_writer import BatchWriter
+
+
+class _SlowEngine:
+    """Engine whose inserts block until released, to hold a write in flight."""
+
+    def __init__(self):
+        self.written = []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    @asynccontextmanager
+    async def begin(self):
+        conn = mock.AsyncMock()
+        staged = []
+
+        async def execute(_stmt, params):
+            self.started.set()
+            await self.release.wait()
+            staged.extend(params if isinstance(params, list) else [params])
+
+        conn.execute.side_effect = execute
+        yield conn
+        # Rows only count once the transaction commits
+        self.written.extend(staged)
+
+
+class TestBatchWriterStop(unittest.TestCase):
+    def test_stop_during_write_keeps_rows(self):
+        async def scenario():
+            engine = _SlowEngine()
+            writer = BatchWriter("test", mock.sentinel.stmt, batch_size=2, flush_interval=10)
+            with mock.patch.object(batch_writer_module, "engine", engine):
+                writer.start()
+                for i in range(5):
+                    writer.enqueue({"id": i})
+                await engine.started.wait()
+
+                stop = asyncio.create_task(writer.stop())
+                await asyncio.sleep(0)
+                engine.release.set()
+                await stop
+            return engine.written
+
+        written = asyncio.run(scenario())
+        self.assertEqual(sorted(row["id"] for row in written), [0, 1, 2, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import importlib
+import sys
+import unittest
+from unittest import mock
+
+from app.core import jsonutil
+
+SAMPLES = [
+    {"sub": "3f2b", "type": "access", "exp": 1700000000},
+    {"name": "Zoë Ångström", "city": "東京", "emoji": "🙂"},
+    {"nested": {"list": [1, 2.5, True, None, "x"]}, "empty": {}},
+]
+
+
+def _fallback_module():
+    """Load jsonutil as it behaves without orjson installed."""
+    with mock.patch.dict(sys.modules, {"orjson": None}):
+        return importlib.reload(jsonutil)
+
+
+class TestJsonUtil(unittest.TestCase):
+    def tearDown(self):
+        importlib.reload(jsonutil)
+
+    def test_fallback_matches_orjson(self):
+        try:
+            import orjson
+        except ImportError:
+            self.skipTest("orjson is not installed")
+        fallback = _fallback_module()
+        for obj in SAMPLES:
+            with self.subTest(obj=obj):
+                self.assertEqual(fallback.dumps_bytes(obj), orjson.dumps(obj))
+
+    def test_fallback_writes_utf8(self):
+        fallback = _fallback_module()
+        self.assertEqual(fallback.dumps_bytes({"a": "é"}), '{"a":"é"}'.encode())
+        self.assertEqual(fallback.dumps({"a": 1, "b": [1, 2]}), '{"a":1,"b":[1,2]}')
+
+    def test_default_is_applied(self):
+        class Opaque:
+            def __str__(self):
+                return "opaque"
+
+        for module in (importlib.reload(jsonutil), _fallback_module()):
+            with self.subTest(module=module):
+                self.assertEqual(module.dumps({"v": Opaque()}, default=str), '{"v":"opaque"}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import asyncio
+import unittest
+from contextlib import asynccontextmanager
+from unittest import mock
+
+from sqlalchemy.exc import IntegrityError
+
+from app.models.history import METADATA_MAX_BYTES, TRUNCATED_METADATA, cap_metadata
+from app.workers import batch_writer as batch_writer_module
+from app.workers.usage_writer import usage_writer
+
+
+class TestCapMetadata(unittest.TestCase):
+    def test_keeps_small_metadata(self):
+        value = {"size": 1024, "ratio": 0.5, "name": "ü.pdf"}
+        self.assertIs(cap_metadata(value), value)
+        self.assertIsNone(cap_metadata(None))
+
+    def test_truncates_large_metadata(self):
+        value = {"text": "x" * METADATA_MAX_BYTES}
+        self.assertEqual(cap_metadata(value), TRUNCATED_METADATA)
+
+    def test_counts_floats_as_postgres_prints_them(self):
+        # 1e-300 is 6 bytes in JSON but 302 in jsonb::text
+        value = {"values": [1e-300] * 20}
+        self.assertEqual(cap_metadata(value), TRUNCATED_METADATA)
+        value = {"values": [1e300] * 20}
+        self.assertEqual(cap_metadata(value), TRUNCATED_METADATA)
+
+
+class _FakeEngine:
+    """Engine whose inserts fail for any batch or row containing a bad row."""
+
+    def __init__(self):
+        self.written = []
+
+    @asynccontextmanager
+    async def begin(self):
+        conn = mock.AsyncMock()
+
+        async def execute(_stmt, params):
+            rows = params if isinstance(params, list) else [params]
+            if any(row.get("bad") for row in rows):
+                raise IntegrityError("INSERT", params, Exception("usage_metadata_size"))
+            self.written.extend(rows)
+
+        conn.execute.side_effect = execute
+        yield conn
+
+
+class TestUsageWriterBatch(unittest.TestCase):
+    def test_bad_row_does_not_drop_batch(self):
+        engine = _FakeEngine()
+        batch = [{"id": 1}, {"id": 2, "bad": True}, {"id": 3}]
+        with mock.patch.object(batch_writer_module, "engine", engine), \
+                self.assertLogs(batch_writer_module.logger, "ERROR"):
+            asyncio.run(usage_writer._write_batch(batch))
+        self.assertEqual(engine.written, [{"id": 1}, {"id": 3}])
+
+
+if __name__ == "__main__":
+    unittest.main()
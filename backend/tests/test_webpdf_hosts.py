@@ -0,0 +1,68 @@
+import unittest
+from urllib.parse import urlsplit
+
+from app.api.v1.tools.webpdf import _is_blocked_host
+
+
+def _host(url):
+    return urlsplit(url).hostname or ""
+
+
+class TestWebPdfBlockedHosts(unittest.TestCase):
+    def test_blocks_internal_names(self):
+        for url in (
+            "http://localhost/",
+            "http://LOCALHOST/",
+            "http://localhost./",
+            "http://app.localhost/",
+            "http://internal/",
+            "http://foo.internal./",
+        ):
+            with self.subTest(url=url):
+                self.assertTrue(_is_blocked_host(_host(url)))
+
+    def test_blocks_non_global_addresses(self):
+        for url in (
+            "http://127.0.0.1/",
+            "http://10.0.0.1/",
+            "http://172.16.0.1/",
+            "http://192.168.1.1/",
+            "http://169.254.169.254/",
+            "http://100.64.0.1/",
+            "http://0.0.0.0/",
+            "http://[::1]/",
+            "http://[::]/",
+            "http://[fe80::1]/",
+            "http://[fd00::1]/",
+            "http://[::ffff:127.0.0.1]/",
+        ):
+            with self.subTest(url=url):
+                self.assertTrue(_is_blocked_host(_host(url)))
+
+    def test_blocks_numeric_host_forms(self):
+        for url in (
+            "http://2130706433/",
+            "http://0177.0.0.1/",
+            "http://0x7f000001/",
+            "http://127.1/",
+            "http://0/",
+        ):
+            with self.subTest(url=url):
+                self.assertTrue(_is_blocked_host(_host(url)))
+
+    def test_allows_public_hosts(self):
+        for url in (
+            "https://example.com/",
+            "https://example.com./",
+            "https://8.8.8.8/",
+            "https://[2001:4860:4860::8888]/",
+            "https://172.32.0.1/",
+            "https://10gen.com/",
+            "https://internal.example.com/",
+        ):
+            with self.subTest(url=url):
+                self.assertFalse(_is_blocked_host(_host(url)))
+
+
+if __name__ == "__main__":
+    unittest.main()